@@ -64,6 +64,9 @@ class Platform:
     @classmethod
     def get_platform_id_by_name(cls, platform, is_check_valid_id=False):
         # platform - name or id, all other values will be converted to None
+        if type(platform) is int:
+            # (Ids can't match any name, so skip str() and upper())
+            return platform if not is_check_valid_id or platform in cls.name_by_id else None
         if isinstance(platform, str) and platform.isnumeric():
             platform = int(platform)
         return cls._internal_id_by_name.get(
@@ -414,6 +417,8 @@ class Endpoint:
         TRANSFER,
         LEVERAGE_SET,
     ]
+    # (For fast check_is_private(), which is called on parsing each WS message)
+    _private_endpoint_set = frozenset(private_endpoints)
 
     @classmethod
     def convert_to_endpoints(cls, endpoints):
@@ -426,7 +431,7 @@ class Endpoint:
 
     @classmethod
     def check_is_private(cls, endpoint):
-        return endpoint in cls.private_endpoints
+        return endpoint in cls._private_endpoint_set
 
 
 class Symbol:
@@ -2182,28 +2187,38 @@ def check_items_order(items):
         return
     if not isinstance(items, list):
         return
-    if hasattr(items[-1], 'timestamp') and items[-1].timestamp:
-        if items[-1].timestamp > items[0].timestamp:
-            return Sorting.ASCENDING
-        elif items[-1].timestamp < items[0].timestamp:
-            return Sorting.DESCENDING
+    last_timestamp = getattr(items[-1], 'timestamp', None)
+    if not last_timestamp:
+        return
+    first_timestamp = items[0].timestamp
+    if last_timestamp > first_timestamp:
+        return Sorting.ASCENDING
+    elif last_timestamp < first_timestamp:
+        return Sorting.DESCENDING
+
+
+_get_timestamp = attrgetter('timestamp')
 
 
 def sort_items(items, sorting=Sorting.ASCENDING):
+    # (Items without timestamp, e.g. Balance-s, are returned as is without trying to sort)
+    if not items or isinstance(items, (list, tuple)) and getattr(items[0], 'timestamp', None) is None:
+        return items
     try:
-        if sorting == Sorting.ASCENDING:
-            return sorted(items, key=attrgetter('timestamp'))
-        else:
-            return sorted(items, key=attrgetter('timestamp'), reverse=True)
+        return sorted(items, key=_get_timestamp, reverse=sorting != Sorting.ASCENDING)
     except (KeyError, TypeError, AttributeError, ValueError):
         return items
 
 
 def filter_items_by_last_id(items, last_item):
-    try:
-        return items[items.index(last_item):]
-    except (KeyError, TypeError, AttributeError, ValueError):
+    if not items or last_item is None:
         return items
+    # (Compare item_id-s first, as full ItemObject.__eq__ is much slower)
+    last_item_id = getattr(last_item, 'item_id', None)
+    for i, item in enumerate(items):
+        if item is last_item or getattr(item, 'item_id', None) == last_item_id and item == last_item:
+            return items[i:]
+    return items
 
 
 def get_latest_item(items):
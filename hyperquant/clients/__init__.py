@@ -3157,8 +3157,9 @@ class WSConverter(ProtocolConverter):
         result = set()
         for endpoint in endpoints:
             params_list = self._break_params_to_params_list(endpoint, params) or [{}]
+            is_symbol_endpoint = endpoint in self.symbol_endpoints
             for params_item in params_list:
-                if endpoint in self.symbol_endpoints:
+                if is_symbol_endpoint:
                     if symbols:
                         for symbol in symbols:
                             # (There is an exception when setting symbol in method params and in **params)
@@ -1,7 +1,6 @@
 import logging
 
 from hyperquant.api import Endpoint, ParamName, Platform, OrderStatus, Sorting, TransactionType
-from hyperquant.clients import Error, ErrorCode
 from hyperquant.clients.tests.test_init import (TestPlatformRESTClientCommon,
                                                 TestPlatformRESTClientHistory,
                                                 TestPlatformRESTClientPrivate,
@@ -5,7 +5,6 @@ from hyperquant.clients.binance import BinanceWSConverterV1
 from hyperquant.clients.tests.test_init import (TestPrivateWSClient,
                                                 TestProtocolConverter,
                                                 TestWSClient)
-from hyperquant.clients.utils import create_ws_client
 
 
 class TestBinanceWSConverterV1(TestProtocolConverter):
@@ -1,11 +1,12 @@
 import itertools
 import json
 import logging
+import threading
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List, Union
-from unittest import TestCase
+from unittest import SkipTest, TestCase
 from unittest.mock import Mock
 
 from websocket import ABNF
@@ -29,7 +30,6 @@ from hyperquant.clients import (
     Endpoint,
     Error,
     ErrorCode,
-    ItemObject,
     Order,
     OrderBook,
     OrderBookItem,
@@ -44,12 +44,18 @@ from hyperquant.clients.tests.utils import (
     delete_all_test_orders,
     set_up_logging,
     close_all_positions)
-from hyperquant.clients.utils import create_rest_client, create_ws_client
+from hyperquant.clients.utils import (
+    create_rest_client,
+    create_ws_client,
+    get_or_create_rest_client,
+)
 from hyperquant.utils import time_util
 from hyperquant.utils.test_util import APITestCase
 
 set_up_logging()
 
+_collection_types = (list, tuple, set)
+
 
 class TestCandle(TestCase):
     def test_eq(self):
@@ -319,6 +325,9 @@ class TestClient(TestCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
+        # (Skip base classes once for all their tests, before any client is created)
+        if cls.platform_id is None:
+            raise SkipTest("Skip base class")
         if cls.is_rest:
             cls.client = create_rest_client(cls.platform_id, version=cls.version)
             cls.client_authed = create_rest_client(
@@ -331,7 +340,6 @@ class TestClient(TestCase):
             )
 
     def setUp(self):
-        self.skipIfBase()
         super().setUp()
         if self.is_rest:
             self.client = create_rest_client(self.platform_id, version=self.version)
@@ -349,10 +357,6 @@ class TestClient(TestCase):
         self.client.close()
         super().tearDown()
 
-    def skipIfBase(self):
-        if self.platform_id is None:
-            self.skipTest("Skip base class")
-
     # Utility
 
     def _result_info(self, result, sorting):
@@ -407,6 +411,14 @@ class TestClient(TestCase):
             self, trade, testing_symbol_or_symbols, self.platform_id
         )
 
+    def assertTradesAreValid(self, trades, testing_symbol_or_symbols=None):
+        if not testing_symbol_or_symbols:
+            testing_symbol_or_symbols = self.testing_symbol
+
+        APITestCase.assertTradesAreValid(
+            self, trades, testing_symbol_or_symbols, self.platform_id
+        )
+
     def assertMyTradeIsValid(self, my_trade, testing_symbol_or_symbols=None):
         if not testing_symbol_or_symbols:
             testing_symbol_or_symbols = self.testing_symbol
@@ -733,8 +745,7 @@ class TestPlatformRESTClientCommon(BaseTestRESTClient):
         self.assertGreater(len(result), 1)
         self.assertGreater(len(result), 20)
         self.assertTradeIsValid(result[0])
-        for item in result:
-            self.assertTradeIsValid(item)
+        self.assertTradesAreValid(result)
         self.assertRightSymbols(result)
 
     def test_fetch_trades_errors(self, method_name="fetch_trades", is_auth=False):
@@ -799,8 +810,7 @@ class TestPlatformRESTClientCommon(BaseTestRESTClient):
             default_item_count,
             "Sometimes needs retry (for BitMEX, for example)",
         )
-        for item in result:
-            self.assertTradeIsValid(item)
+        self.assertTradesAreValid(result)
         self.assertRightSymbols(result)
 
     def test_fetch_trades_limit_is_too_big(
@@ -820,8 +830,7 @@ class TestPlatformRESTClientCommon(BaseTestRESTClient):
             self.assertGoodResult(result)
             self.assertGreater(len(result), 10)
             self.assertLess(len(result), too_big_limit)
-            for item in result:
-                self.assertTradeIsValid(item)
+            self.assertTradesAreValid(result)
             self.assertRightSymbols(result)
             max_limit_count = len(result)
 
@@ -2580,6 +2589,8 @@ class TestPlatformRESTClientHistory(BaseTestRESTClient):
                 for item in result:
                     self.assertTradeIsValid(item)
                 self.assertRightSymbols(result)
+                # (Read timestamps once and check the whole page in one pass)
+                timestamps = [item.timestamp for item in result]
                 if sorting == Sorting.ASCENDING:
                     # Oldest first
                     self.assertLess(
@@ -2587,13 +2598,13 @@ class TestPlatformRESTClientHistory(BaseTestRESTClient):
                         prev_result[-1].timestamp,
                         "Error in sorting",
                     )  # Check sorting is ok
-                    self.assertLess(
-                        result[0].timestamp, result[-1].timestamp, "Error in sorting"
+                    self.assertLess(timestamps[0], timestamps[-1], "Error in sorting")
+                    self.assertTrue(
+                        all(t1 <= t2 for t1, t2 in zip(timestamps, timestamps[1:])),
+                        "Error in sorting",
                     )  # Check sorting is ok
                     self.assertLessEqual(
-                        prev_result[-1].timestamp,
-                        result[0].timestamp,
-                        "Error in paging",
+                        prev_result[-1].timestamp, timestamps[0], "Error in paging"
                     )  # Check next page
                 else:
                     # Newest first
@@ -2602,13 +2613,13 @@ class TestPlatformRESTClientHistory(BaseTestRESTClient):
                         prev_result[-1].timestamp,
                         "Error in sorting",
                     )  # Check sorting is ok
-                    self.assertGreater(
-                        result[0].timestamp, result[-1].timestamp, "Error in sorting"
+                    self.assertGreater(timestamps[0], timestamps[-1], "Error in sorting")
+                    self.assertTrue(
+                        all(t1 >= t2 for t1, t2 in zip(timestamps, timestamps[1:])),
+                        "Error in sorting",
                     )  # Check sorting is ok
                     self.assertGreaterEqual(
-                        prev_result[-1].timestamp,
-                        result[0].timestamp,
-                        "Error in paging",
+                        prev_result[-1].timestamp, timestamps[0], "Error in paging"
                     )  # Check next page
 
             if page_count > 2:
@@ -2880,17 +2891,20 @@ class TestWSClient(TestClient):
 
     testing_symbols = ["ETHBTC", "BTCUSD"]
     received_items = None
+    received_event = None
 
     def setUp(self):
-        self.skipIfBase()
-
         super().setUp()
         self.received_items = []
 
+        received_items_extend = self.received_items.extend
+        # (Wakes up waitAndAssertResults() as soon as new items received)
+        self.received_event = received_event = threading.Event()
+
         def on_data(items):
             # if items:
-            items = [item for item in items if isinstance(item, DataObject)]
-            self.received_items.extend(items)
+            received_items_extend(item for item in items if isinstance(item, DataObject))
+            received_event.set()
 
         self.client.on_data = on_data
         self.client_authed.on_data = on_data
@@ -3041,9 +3055,9 @@ class TestWSClient(TestClient):
         client = self.client_authed if is_auth else self.client
         client.use_milliseconds = use_milliseconds
 
-        if not isinstance(endpoints, (list, tuple, set)):
+        if not isinstance(endpoints, _collection_types):
             endpoints = [endpoints]
-        if symbols and not isinstance(symbols, (list, tuple, set)):
+        if symbols and not isinstance(symbols, _collection_types):
             symbols = [symbols]
         if not subscription_count:
             subscription_count = (len(endpoints) if endpoints else 0) * (
@@ -3062,7 +3076,8 @@ class TestWSClient(TestClient):
             item_number=item_number,
         )
         # Assert item.subscription is OK
-        for item in self.received_items.copy():
+        # (on_data only appends, so no need to copy the list, but just to stop at current length)
+        for item in itertools.islice(self.received_items, len(self.received_items)):
             self.assertIn(item.subscription, client.current_subscriptions)
         if self.platform_id not in [Platform.BITMEX, Platform.BINANCE_FUTURE]:
             # supports aggregated subscription
@@ -3196,7 +3211,10 @@ class TestWSClient(TestClient):
         is_auth=False,
         use_milliseconds=True,
     ):
-        failing_recv_data_frame = Mock(side_effect=((ABNF.OPCODE_CLOSE, None),) * 10)
+        # (Endless, so any DISCONNECT_COUNT works without StopIteration)
+        failing_recv_data_frame = Mock(
+            side_effect=itertools.repeat((ABNF.OPCODE_CLOSE, None))
+        )
         self._test_restoring_connection(
             failing_recv_data_frame,
             reconnect_delay_sec,
@@ -3290,6 +3308,7 @@ class TestWSClient(TestClient):
             client,
             is_check_all_received,
             item_number=item_number,
+            event=self.received_event,
         )
 
     # def _get_item_classes_in_endpoints(self, endpoints):
@@ -3328,18 +3347,25 @@ class TestPrivateWSClient(TestClient):
 
     testing_symbols = ["ETHBTC", "BTCUSD"]
     received_items = None
+    received_event = None
 
     def setUp(self):
-        self.skipIfBase()
-
         super().setUp()
         self.received_items = []
         self.open_order = None
+        # (For placing and deleting test orders)
+        self.rest_client_authed = get_or_create_rest_client(
+            self.platform_id, True, pivot_symbol=self.pivot_symbol
+        )
+
+        received_items_extend = self.received_items.extend
+        # (Wakes up waitAndAssertResults() as soon as new items received)
+        self.received_event = received_event = threading.Event()
 
         def on_data(items):
             # if items:
-            items = [item for item in items if isinstance(item, DataObject)]
-            self.received_items.extend(items)
+            received_items_extend(item for item in items if isinstance(item, DataObject))
+            received_event.set()
 
         self.client.on_data = on_data
         self.client_authed.on_data = on_data
@@ -3347,9 +3373,9 @@ class TestPrivateWSClient(TestClient):
     def tearDown(self):
         self.client.close()
         delete_all_test_orders(
-            self.platform_id, self.testing_symbol, pivot_symbol=self.pivot_symbol
+            self.platform_id, self.testing_symbol, self.rest_client_authed
         )
-        close_all_positions(self.platform_id)
+        close_all_positions(self.platform_id, self.rest_client_authed)
         super().tearDown()
 
     def test_balance_channel(self):
@@ -3400,24 +3426,30 @@ class TestPrivateWSClient(TestClient):
         client = self.client_authed if is_auth else self.client
         client.use_milliseconds = use_milliseconds
 
-        if not isinstance(endpoints, (list, tuple, set)):
+        if not isinstance(endpoints, _collection_types):
             endpoints = [endpoints]
-        if symbols and not isinstance(symbols, (list, tuple, set)):
+        if symbols and not isinstance(symbols, _collection_types):
             symbols = [symbols]
 
         client.subscribe(endpoints, symbols, **params or {})
 
-        private_endpoints = [e for e in endpoints if Endpoint.check_is_private(e)]
-        public_endpoints = [e for e in endpoints if not Endpoint.check_is_private(e)]
+        private_endpoints, public_endpoints = [], []
+        for endpoint in endpoints:
+            (private_endpoints if Endpoint.check_is_private(endpoint) else public_endpoints).append(endpoint)
         if private_endpoints:
             time.sleep(2)
             if make_trade:
                 self.open_order = create_test_order(
-                    self.platform_id, self.testing_symbol, market=True
+                    self.platform_id,
+                    self.testing_symbol,
+                    market=True,
+                    rest_auth_client=self.rest_client_authed,
                 )
             else:
                 self.open_order = create_test_order(
-                    self.platform_id, self.testing_symbol
+                    self.platform_id,
+                    self.testing_symbol,
+                    rest_auth_client=self.rest_client_authed,
                 )
             self.waitAndAssertResults(
                 self.received_items,
@@ -3436,7 +3468,8 @@ class TestPrivateWSClient(TestClient):
                 is_check_all_received=True,
             )
             # Assert item.subscription is OK
-            for item in self.received_items.copy():
+            # (on_data only appends, so no need to copy the list, but just to stop at current length)
+            for item in itertools.islice(self.received_items, len(self.received_items)):
                 self.assertIn(item.subscription, client.current_subscriptions)
 
     def waitAndAssertResults(
@@ -3456,4 +3489,5 @@ class TestPrivateWSClient(TestClient):
             platform_ids,
             client,
             is_check_all_received,
+            event=self.received_event,
         )
@@ -4,7 +4,8 @@ from hyperquant.api import Platform, Sorting, sort_items, filter_items_by_last_i
 from hyperquant.clients import Trade, Balance
 from hyperquant.clients.binance import BinanceRESTClient, BinanceWSClient
 from hyperquant.clients.bitmex import BitMEXRESTClient, BitMEXWSClient
-from hyperquant.clients.utils import create_rest_client, create_ws_client
+from hyperquant.clients.utils import clear_client_cache, create_rest_client, create_ws_client, \
+    get_or_create_rest_client
 
 
 class TestCreateClient(unittest.TestCase):
@@ -78,6 +79,28 @@ class TestCreateClient(unittest.TestCase):
         self.assertEqual(client._api_secret, "sss22")
         self.assertTrue(callable(client._credentials))
 
+    def test_get_or_create_rest_client(self):
+        clear_client_cache()
+
+        client = get_or_create_rest_client(Platform.BINANCE)
+        self.assertIsInstance(client, BinanceRESTClient)
+        self.assertIs(get_or_create_rest_client(Platform.BINANCE), client)
+
+        # (Private clients are cached separately by credentials and pivot_symbol)
+        client_authed = get_or_create_rest_client(Platform.BINANCE, True, credentials=("aaa", "sss"))
+        self.assertIsNot(client_authed, client)
+        self.assertIs(get_or_create_rest_client(Platform.BINANCE, True, credentials=("aaa", "sss")), client_authed)
+        self.assertIs(get_or_create_rest_client(Platform.BINANCE, True, credentials=["aaa", "sss", None]),
+                      client_authed)
+        self.assertIs(get_or_create_rest_client("binance", True, credentials=("aaa", "sss")), client_authed)
+        self.assertIsNot(get_or_create_rest_client(Platform.BINANCE, True, credentials=("aaa22", "sss22")),
+                         client_authed)
+        self.assertIsNot(get_or_create_rest_client(Platform.BINANCE, True, credentials=("aaa", "sss"),
+                                                   pivot_symbol="USDT"), client_authed)
+
+        clear_client_cache()
+        self.assertIsNot(get_or_create_rest_client(Platform.BINANCE), client)
+
 
 class TestSomeSeparateUtils(unittest.TestCase):
 
@@ -123,4 +146,12 @@ class TestSomeSeparateUtils(unittest.TestCase):
         self.assertEqual(filter_items_by_last_id(items, last_trade), [t2, t3])
         last_trade = Trade(item_id=3)
         self.assertEqual(filter_items_by_last_id(items, last_trade), [t3])
+        # (Same item_id, but another item)
+        last_trade = Trade(symbol="ETHBTC", item_id=2)
+        self.assertEqual(filter_items_by_last_id(items, last_trade), [t1, t2, t3])
+        # (No item_id - compared by timestamp)
+        t1, t2 = Trade(timestamp=1000000000), Trade(timestamp=2000000000)
+        items = [t1, t2]
+        self.assertEqual(filter_items_by_last_id(items, Trade(timestamp=2000000000)), [t2])
+        self.assertEqual(filter_items_by_last_id(items, Trade(timestamp=3000000000)), [t1, t2])
 
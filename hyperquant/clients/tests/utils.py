@@ -1,8 +1,10 @@
 import datetime
 import logging
 import os
+import random
 import sys
 import time
+from functools import lru_cache
 from typing import Any
 
 from hyperquant.api import Direction, OrderType, ParamName, Platform
@@ -44,20 +46,24 @@ def _generate_log_filename():
 def wait_for_history(history_connector, timeout_sec=10):
     # Wait for item_list is of "count" length or "timeout_sec" elapsed.
     start_time = time.time()
-    logger.debug("\n### Waiting a history_connector or timeout_sec: %s" %
+    logger.debug("\n### Waiting a history_connector or timeout_sec: %s",
                  timeout_sec)
+    sleep_sec = 0.01
     while not timeout_sec or time.time() - start_time < timeout_sec:
         if not history_connector.is_in_progress:
             if history_connector.is_complete:
                 logger.debug(
-                    "\n### All (or no) history retrieved in: %s seconds" %
-                    (time.time() - start_time))
+                    "\n### All (or no) history retrieved in: %s seconds",
+                    time.time() - start_time)
             else:
                 logger.debug(
-                    "\n### All history closed complete. Worked: %s seconds" %
-                    (time.time() - start_time))
+                    "\n### All history closed complete. Worked: %s seconds",
+                    time.time() - start_time)
             return True
-        time.sleep(min(3, timeout_sec / 10) if timeout_sec else 1)
+        # (Exponential backoff: fast completions are noticed at once,
+        # while long ones are not polled too often)
+        time.sleep(sleep_sec)
+        sleep_sec = min(sleep_sec * 2, 0.5)
     logger.debug("\n### Time is out! (history_connector)")
     raise Exception("Time is out!")
     # return False
@@ -78,23 +84,32 @@ def get_min_price(platform_id, symbol, side, rest_auth_client=None):
         return book.bids[-1].price
 
 
+# (Min amount is fixed enough for a test session, and it takes requests to get it)
+@lru_cache(maxsize=256)
+def _get_symbol_min_amount(platform_id, symbol):
+    return SingleDataAggregator().get_symbol_min_amount(platform_id, symbol)
+
+
 def create_test_order(platform_id,
                       symbol=None,
                       side=Direction.BUY,
                       sleep_before=0,
                       market=False,
-                      pivot_symbol='BTC'):
-    while True:
-        time.sleep(sleep_before)
-        if isinstance(symbol, list):
-            symbol = symbol[0]
+                      pivot_symbol='BTC',
+                      attempts=5,
+                      rest_auth_client=None):
+    time.sleep(sleep_before)
+    if isinstance(symbol, list):
+        symbol = symbol[0] if symbol else None
+    if not rest_auth_client:
         rest_auth_client = get_or_create_rest_client(
             platform_id,
             True,
             credentials=get_credentials_for(platform_id),
             pivot_symbol=pivot_symbol)
-        if not symbol:
-            symbol = rest_auth_client.get_symbols()[0]
+    if not symbol:
+        symbol = rest_auth_client.get_symbols()[0]
+    for attempt in range(attempts):
         # rest_auth_client.close_all_positions()
         # orders_debug = rest_auth_client.fetch_orders(symbol, is_open_only=True)
         # balances_debug = rest_auth_client.fetch_balance()
@@ -102,7 +117,7 @@ def create_test_order(platform_id,
         if platform_id == Platform.BITMEX:
             min_amount = 1
         else:
-            min_amount = SingleDataAggregator().get_symbol_min_amount(platform_id, symbol)
+            min_amount = _get_symbol_min_amount(platform_id, symbol)
         if not market:
             price_to_place = get_min_price(platform_id, symbol, side,
                                            rest_auth_client)
@@ -125,13 +140,17 @@ def create_test_order(platform_id,
                                               is_test=False)
         if isinstance(order, Error):
             if 'The system is currently overloaded' in order.message:
-                logger.warning("Can't place test order, RETRY after 30 sec",
-                               str(order.message))
-                time.sleep(30)
+                if attempt < attempts - 1:
+                    # (Jitter not to retry at the same time with other tests)
+                    retry_delay_sec = 10 + random.random() * 20
+                    logger.warning("Can't place test order, RETRY after %.1f sec: %s",
+                                   retry_delay_sec, order.message)
+                    time.sleep(retry_delay_sec)
             else:
                 raise Exception("Can't place test order", str(order))
         else:
             return order
+    raise Exception("Can't place test order after %s attempts" % attempts, str(order))
 
 
 def delete_all_test_orders(platform_id,
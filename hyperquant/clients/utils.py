@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import settings
 from hyperquant.api import ParamName, Platform, PlatformCredentials
 from hyperquant.clients.binance import BinanceRESTClient, BinanceWSClient
@@ -17,11 +19,16 @@ _ws_client_class_by_platform_id = {
     Platform.BINANCE_FUTURE: BinanceFutureWSClient,
 }
 
-# Cache of clients (may be private clients need also api_key key in lookup, not only platform_id)
-_rest_client_by_platform_id = {}
-_private_rest_client_by_platform_id = {}
-_ws_client_by_platform_id = {}
-_private_ws_client_by_platform_id = {}
+_client_class_by_is_rest_and_platform_id = {
+    **{(True, platform_id): client_class
+       for platform_id, client_class in _rest_client_class_by_platform_id.items()},
+    **{(False, platform_id): client_class
+       for platform_id, client_class in _ws_client_class_by_platform_id.items()},
+}
+
+# Cache of clients by (platform_id, is_rest, is_private, credentials, pivot_symbol)
+# (credentials and pivot_symbol are None for public clients)
+_client_by_key = {}
 
 
 def create_rest_client(platform_id,
@@ -64,6 +71,9 @@ def get_or_create_ws_client(platform_id,
                                  credentials, pivot_symbol, **kwargs)
 
 
+# (Settings are loaded once, so credentials are cached. Call
+# get_credentials_for.cache_clear() if settings are changed in runtime)
+@lru_cache(maxsize=128)
 def get_credentials_for(platform_id):
     platform_name = Platform.get_platform_name_by_id(platform_id)
     credentials_template = PlatformCredentials.get_template_by_id(platform_id)
@@ -87,8 +97,7 @@ def _create_client(platform_id,
                    **kwargs):
     # Create
     platform_id = Platform.get_platform_id_by_name(platform_id)
-    class_lookup = _rest_client_class_by_platform_id if is_rest else _ws_client_class_by_platform_id
-    client_class = class_lookup.get(platform_id)
+    client_class = _client_class_by_is_rest_and_platform_id.get((is_rest, platform_id))
     if not client_class:
         return None
 
@@ -119,59 +128,68 @@ def _get_or_create_client(platform_id,
                           **kwargs):
     # Get
     if lookup is None:
-        if is_rest:
-            lookup = _private_rest_client_by_platform_id if is_private else _rest_client_by_platform_id
-        else:
-            lookup = _private_ws_client_by_platform_id if is_private else _ws_client_by_platform_id
-    if platform_id in lookup:
-        if is_private:
-            if platform_id not in lookup:
-                lookup[platform_id] = {}
-            if credentials not in lookup[platform_id]:
-                lookup[platform_id][credentials] = {}
-            client = lookup[platform_id][credentials].get(pivot_symbol)
-        else:
-            client = lookup.get(platform_id)
-        if client:
-            return client
-
-    # Create
+        lookup = _client_by_key
+    platform_id = Platform.get_platform_id_by_name(platform_id)
     if is_private:
-        client = _create_client(platform_id,
-                                is_rest,
-                                is_private,
-                                credentials=credentials,
-                                pivot_symbol=pivot_symbol,
-                                **kwargs)
-        if platform_id not in lookup:
-            lookup[platform_id] = {}
-        if credentials not in lookup[platform_id]:
-            lookup[platform_id][credentials] = {}
-        lookup[platform_id][credentials][pivot_symbol] = client
+        credentials_key = _get_credentials_key(platform_id, credentials)
     else:
-        lookup[platform_id] = client = _create_client(platform_id, is_rest,
-                                                      is_private, **kwargs)
-    return client
+        # (Public clients don't depend on credentials and pivot_symbol)
+        credentials = credentials_key = pivot_symbol = None
+    key = (platform_id, is_rest, is_private, credentials_key, pivot_symbol)
+    client = lookup.get(key)
+    if client is not None:
+        return client
 
+    # Create
+    client = _create_client(platform_id,
+                            is_rest,
+                            is_private,
+                            credentials=credentials,
+                            pivot_symbol=pivot_symbol,
+                            **kwargs)
+    if client is None:
+        return None
+    # (setdefault() is atomic, so threads racing here all get the first stored client)
+    return lookup.setdefault(key, client)
 
-def set_up_symbols_lookup_on_client(client, platform_id):
-    platform_symbol_by_common_symbol_by_platform_id = {
-        Platform.BINANCE: {
-            "BTCUSD": "BTCUSDT",
-        },
-        Platform.BITMEX: {
-            "BTCUSD": "XBTUSD",
-        }
+
+def _get_credentials_key(platform_id, credentials):
+    # (Same credentials may come as None (from settings), 2- or 3-tuple, list or dict)
+    if callable(credentials):
+        return credentials
+    return PlatformCredentials.to_common_with_passphrase(
+        credentials or get_credentials_for(platform_id))
+
+
+def clear_client_cache():
+    _client_by_key.clear()
+
+
+_platform_symbol_by_common_symbol_by_platform_id = {
+    Platform.BINANCE: {
+        "BTCUSD": "BTCUSDT",
+    },
+    Platform.BITMEX: {
+        "BTCUSD": "XBTUSD",
     }
+}
+_common_symbol_by_platform_symbol_by_platform_id = {
+    platform_id: {ps: s for s, ps in platform_symbol_by_common_symbol.items()}
+    for platform_id, platform_symbol_by_common_symbol
+    in _platform_symbol_by_common_symbol_by_platform_id.items()
+}
+
+
+def set_up_symbols_lookup_on_client(client, platform_id):
     platform_symbol_by_common_symbol = \
-        platform_symbol_by_common_symbol_by_platform_id.get(platform_id)
+        _platform_symbol_by_common_symbol_by_platform_id.get(platform_id)
     if not client or not platform_symbol_by_common_symbol:
         return
 
-    if not client.converter.param_value_lookup.get(ParamName.SYMBOL):
-        client.converter.param_value_lookup[ParamName.SYMBOL] = {}
-    if not client.converter.param_value_reversed_lookup.get(ParamName.SYMBOL):
-        client.converter.param_value_reversed_lookup[ParamName.SYMBOL] = {}
-    for s, ps in platform_symbol_by_common_symbol.items():
-        client.converter.param_value_lookup[ParamName.SYMBOL][s] = ps
-        client.converter.param_value_reversed_lookup[ParamName.SYMBOL][ps] = s
+    converter = client.converter
+    lookup = converter.param_value_lookup[ParamName.SYMBOL] = \
+        converter.param_value_lookup.get(ParamName.SYMBOL) or {}
+    lookup.update(platform_symbol_by_common_symbol)
+    reversed_lookup = converter.param_value_reversed_lookup[ParamName.SYMBOL] = \
+        converter.param_value_reversed_lookup.get(ParamName.SYMBOL) or {}
+    reversed_lookup.update(_common_symbol_by_platform_symbol_by_platform_id[platform_id])
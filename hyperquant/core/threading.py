@@ -1,20 +1,15 @@
-from threading import Condition, Lock
+from threading import Event
 
 
 class Trigger:
     def __init__(self):
-        self._cond = Condition(Lock())
-        self._flag = False
+        self._event = Event()
 
     def call(self):
-        with self._cond:
-            self._flag = True
-            self._cond.notify_all()
+        self._event.set()
 
     def wait(self, timeout=None):
-        with self._cond:
-            signaled = self._flag
-            if not signaled:
-                signaled = self._cond.wait(timeout)
-            self._flag = False
-            return signaled
+        signaled = self._event.wait(timeout)
+        # (Auto-reset: each wait() consumes the signal, so following calls wait for the next call())
+        self._event.clear()
+        return signaled
@@ -1,6 +1,9 @@
 import logging
-from collections import Iterable
+from collections.abc import Iterable
 from decimal import Decimal
+from operator import attrgetter, itemgetter
+
+logger = logging.getLogger(__name__)
 
 
 def inverse_dict(lookup):
@@ -9,12 +12,7 @@ def inverse_dict(lookup):
 
     result = {}
     for k, v in lookup.items():
-        if v in result:
-            if not isinstance(result[v], list):
-                result[v] = [result[v]]
-            result[v].append(k)
-        else:
-            result[v] = [k]
+        result.setdefault(v, []).append(k)
     return result
 
 
@@ -35,9 +33,7 @@ def convert_items_to_grouped_lookup(list_items, field_count):
                 # sub_lookup.append(prop)
             else:
                 is_pre_final_prop = i == last_index - 1
-                if prop not in sub_lookup:
-                    sub_lookup[prop] = [] if is_pre_final_prop else {}
-                sub_lookup = sub_lookup[prop]
+                sub_lookup = sub_lookup.setdefault(prop, [] if is_pre_final_prop else {})
     return lookup
 
 
@@ -45,67 +41,114 @@ def group_items(items, fields):
     if not items or not fields:
         return items
 
+    # (Getters are built once per kind and chosen per item, as dicts and objects may be mixed)
+    item_getters = [itemgetter(field) for field in fields[:-1]], itemgetter(fields[-1])
+    attr_getters = [attrgetter(field) for field in fields[:-1]], attrgetter(fields[-1])
     lookup = {}
-    field_count = len(fields)
     for item in items:
+        get_values, get_final_value = item_getters if isinstance(item, dict) else attr_getters
         sublookup = lookup
-        for i, field in enumerate(fields):
-            is_final_field = i == field_count - 1
-            value = item[field] if isinstance(item, dict) else getattr(item, field)
-            sublookup[value] = sublookup.get(value, [] if is_final_field else {})
-            sublookup = sublookup[value]
-            if is_final_field:
-                sublookup.append(item)
+        for get_value in get_values:
+            sublookup = sublookup.setdefault(get_value(item), {})
+        sublookup.setdefault(get_final_value(item), []).append(item)
     return lookup
 
 
+_set_types = frozenset((set, frozenset, dict))
+_sequence_types = frozenset((list, tuple))
+
+
 def filter_keys(target_dict, properties_source):
-    is_source_iterable = isinstance(properties_source, Iterable)
-    return {k: v for k, v in target_dict.items()
-            if hasattr(properties_source, k) or (k in properties_source if is_source_iterable else False)} if \
-        isinstance(target_dict, dict) and properties_source is not None else target_dict
+    if not isinstance(target_dict, dict) or properties_source is None:
+        return target_dict
+
+    # (Plain containers: one set membership check per key instead of hasattr())
+    source_type = type(properties_source)
+    if source_type in _set_types:
+        allowed = properties_source
+    elif source_type in _sequence_types:
+        allowed = set(properties_source)
+    else:
+        # (Other objects, including namedtuples and enums, may have keys as attributes)
+        is_source_iterable = isinstance(properties_source, Iterable)
+        return {k: v for k, v in target_dict.items()
+                if hasattr(properties_source, k) or (k in properties_source if is_source_iterable else False)}
+    return {k: v for k, v in target_dict.items() if k in allowed}
+
+
+# (Leaf types returned as is without a recursive call)
+_scalar_types = frozenset((type(None), bool, int, float, Decimal, str, bytes))
 
 
 def deepcopy(obj):
     # Deep copy, but only for standard data structures: dict, list, tuple, set
+    obj_type = type(obj)
+    if obj_type in _scalar_types:
+        return obj
     if isinstance(obj, dict):
-        return {deepcopy(k): deepcopy(v) for k, v in obj.items()}
+        return {k if type(k) in _scalar_types else deepcopy(k): v if type(v) in _scalar_types else deepcopy(v)
+                for k, v in obj.items()}
     elif isinstance(obj, list):
-        return [deepcopy(v) for v in obj]
+        return [v if type(v) in _scalar_types else deepcopy(v) for v in obj]
     elif isinstance(obj, tuple):
-        return tuple(deepcopy(v) for v in obj)
+        return tuple(v if type(v) in _scalar_types else deepcopy(v) for v in obj)
     elif isinstance(obj, set):
-        return {deepcopy(v) for v in obj}
+        return {v if type(v) in _scalar_types else deepcopy(v) for v in obj}
     return obj
 
 
+_number_types = frozenset((int, float, Decimal))
+_hashable_scalar_types = frozenset((str, int, Decimal))
+
+
 def check_is_sub_data(data, sub_data):
     if data == sub_data:
         return True
     if data is None or sub_data is None:
         return False
-    if isinstance(sub_data, (int, float, Decimal)):
+    # (Exact type checks first for the most common scalars)
+    sub_data_type = type(sub_data)
+    if sub_data_type in _number_types or isinstance(sub_data, (int, float, Decimal)):
         return data >= sub_data
-    if isinstance(sub_data, str):
+    if sub_data_type is str or isinstance(sub_data, str):
         return sub_data in data
-    if type(data) != type(sub_data):
+    if type(data) != sub_data_type:
         return False
 
     if isinstance(sub_data, dict):
-        for k, v in sub_data.items():
-            if isinstance(v, (dict, list, tuple)):
-                # Nesting check is only for dicts
-                if k not in data or not check_is_sub_data(data[k], v):
-                    logging.debug(f"check_is_sub_data: Key {k} not in dict {data}" if k not in data
-                                  else f"check_is_sub_data: {v} \nis not sub_data of {data[k]}")
+        # (Fast path: all items are in data as is, compared in C. Otherwise nested
+        # dicts, lists and tuples may still match as sub data, so check them one by one)
+        if sub_data.items() <= data.items():
+            return True
+        # (Nested dicts are checked with a stack instead of recursive calls)
+        stack = [(data, sub_data)]
+        while stack:
+            data, sub_data = stack.pop()
+            for k, v in sub_data.items():
+                if k not in data:
+                    logger.debug("check_is_sub_data: Key %s not in dict %s", k, data)
+                    return False
+                value = data[k]
+                if isinstance(v, dict) and type(value) == type(v):
+                    # Nesting check is only for dicts
+                    stack.append((value, v))
+                elif isinstance(v, (dict, list, tuple)):
+                    if not check_is_sub_data(value, v):
+                        logger.debug("check_is_sub_data: %s \nis not sub_data of %s", v, value)
+                        return False
+                elif value != v:
+                    logger.debug("check_is_sub_data: %s %s != %s", k, v, value)
                     return False
-            elif k not in data or data[k] != v:
-                logging.debug(f"check_is_sub_data: Key {k} not in dict {data}" if k not in data
-                              else f"check_is_sub_data: {k} {v} != {data[k]}")
-                return False
         return True
 
+    # (Set of scalar data items for O(1) lookups instead of scanning data for each item.
+    # Only types whose hash agrees with == are put in it, and a miss falls back to the scan)
+    data_lookup = None
+    if isinstance(data, (list, tuple)) and len(sub_data) > 1:
+        data_lookup = {v for v in data if type(v) in _hashable_scalar_types}
     for k, v in enumerate(sub_data):
+        if data_lookup is not None and type(v) in _hashable_scalar_types and v in data_lookup:
+            continue
         # (Check for __getitem__ to know that data supports indexing)
         if v not in data and (not hasattr(data, "__getitem__") or not check_is_sub_data(data[k], v)):
             return False
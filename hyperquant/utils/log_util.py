@@ -1,37 +1,48 @@
-from copy import deepcopy
+import re
+
+_secret_key_re = re.compile(r"PASS|PWD", re.IGNORECASE)
 
 
 def make_short_str(string, max_len=200, is_strip_in_the_middle=True):
-    string = str(string)
+    if type(string) is not str:
+        string = str(string)
     if len(string) <= max_len or max_len < 0:
         return string
 
     if is_strip_in_the_middle:
         slice_num = round(max_len / 2)
-        return string[:slice_num] + "<...>" + string[-slice_num:]
+        return f"{string[:slice_num]}<...>{string[-slice_num:]}"
 
-    return string[:max_len] + "..."
+    return f"{string[:max_len]}..."
 
 
 def items_to_interval_string(items, max_show_items_count=2):
-    if not items or not isinstance(items, (list, tuple)):
+    # (Any sized indexable sequence, not only list and tuple)
+    if not items or isinstance(items, (str, bytes, dict)) or \
+            not hasattr(items, "__len__") or not hasattr(items, "__getitem__"):
         return items
     count = len(items)
 
     if max_show_items_count >= count:
-        return "(count): %s (items): %s" % (count, items)
+        return f"(count): {count} (items): {items}"
     if max_show_items_count == 2:
-        return "(count): %s (first..last): %s .. %s" % (count, items[0], items[-1])
-    return "(count): %s (items): [%s .. %s]" % (
-        count, ", ".join(map(str, items[0:max_show_items_count - 1])), items[-1])
+        return f"(count): {count} (first..last): {items[0]} .. {items[-1]}"
+    head = items[:max_show_items_count - 1]
+    return f"(count): {count} (items): [{', '.join(map(str, head))} .. {items[-1]}]"
 
 
 def protect_secret_data(data):
     if not isinstance(data, dict):
         return data
-    data = deepcopy(data)
-    for k, v in data.items():
-        key = k.upper()
-        if k and v and ("PASS" in key or "PWD" in key):
-            data[k] = v[:1] + "..." + v[-1:] if isinstance(v, str) and len(v) > 4 else "..."
+    # (Most data has no secrets, so don't copy it)
+    # (Non-str keys can't be secret ones, and re can't search in them)
+    secret_keys = [k for k, v in data.items()
+                   if v and isinstance(k, str) and _secret_key_re.search(k)]
+    if not secret_keys:
+        return data
+    # (Only top-level values are replaced, so a shallow copy is enough)
+    data = dict(data)
+    for k in secret_keys:
+        v = data[k]
+        data[k] = v[:1] + "..." + v[-1:] if isinstance(v, str) and len(v) > 4 else "..."
     return data
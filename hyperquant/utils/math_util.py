@@ -1,19 +1,30 @@
 import math
 from decimal import Decimal
+from functools import lru_cache
 
 
 def drop_trailing_zeros(value: Decimal) -> Decimal:
     if value == 0:
         return Decimal('0')
     assert isinstance(value, Decimal)
-    t = value.as_tuple()
-    i = -1
-    while i >= t[2] and t[1][i] == 0:
-        i -= 1
-    if i == -1:
+    sign, digits, exponent = value.as_tuple()
+    if exponent >= 0 or digits[-1]:
         return value
-    i += 1
-    return Decimal((t[0], t[1][:i], t[2] - i))
+    # (Digits are sliced as is (no context rounding) and only fractional zeros are dropped)
+    count = len(digits)
+    end = count
+    min_end = count + exponent
+    while end > min_end and digits[end - 1] == 0:
+        end -= 1
+    return Decimal((sign, digits[:end], exponent + count - end))
+
+
+# (typed: float and Decimal ticks are equal as keys, but only the former may be a power of ten)
+@lru_cache(maxsize=256, typed=True)
+def _get_tick_precision(tick_size):
+    precision = math.ceil(-math.log10(tick_size))
+    # (Also whether tick_size is exactly 10**-precision: 0.01, 1, 10, ...)
+    return precision, tick_size == type(tick_size)(10) ** -precision
 
 
 def round_to_tick(value, tick_size=0, round_fun=None):
@@ -26,12 +37,17 @@ def round_to_tick(value, tick_size=0, round_fun=None):
     if isinstance(value, Decimal):
         tick_size = Decimal(tick_size)
 
+    precision, is_power_of_ten = _get_tick_precision(tick_size)
+    if is_power_of_ten and round_fun is round and type(value) is float:
+        # (Nearest multiple of 10**-precision is what round() returns itself.
+        # Only for floats: for Decimals round() may give exponent form (5.0E+2) or -0,
+        # and for ints the result type may differ from the general path below)
+        return round(value, precision)
+
     # Fix math.floor/ceil for precision
     real_round_fun = (lambda val, prec: round_fun(val * pow(10, prec)) / pow(10, prec)) \
         if round_fun != round else round_fun
 
-    log = math.log10(tick_size)
-    precision = math.ceil(-log)
     value = real_round_fun(value, precision)
 
     rest = value % tick_size
@@ -1,7 +1,12 @@
+import itertools
 import logging
-import logging
+import os
+import re
 import time
+from collections import Counter, defaultdict
 from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
 from unittest import TestCase
 
 from hyperquant.api import (
@@ -15,36 +20,91 @@ from hyperquant.clients import (
     Quote, Ticker, Trade,
 )
 
-
-def wait_for(value_or_callable, min_count=2, timeout_sec=10.):
+# (HQ_FAST_ASSERT=1 - validate only the first and the last item in batch asserts, for quick runs)
+_is_fast_assert = os.environ.get("HQ_FAST_ASSERT", "0") not in ("", "0")
+
+# (Compiled once instead of on each assertItemIsValid() call)
+_symbol_re = re.compile("[A-Z]+")
+_timestamp_types = (float, int)
+# (Valid values as frozensets for O(1) membership checks of each item)
+_direction_values = frozenset(Direction.name_by_value)
+_order_book_direction_values = frozenset(OrderBookDirection.name_by_value)
+_order_status_values = frozenset(OrderStatus.name_by_value)
+_order_type_values = frozenset(OrderType.name_by_value)
+_candle_intervals = frozenset(CandleInterval.ALL)
+_transaction_types = frozenset(TransactionType.ALL)
+# (Platform exceptions for item asserts)
+_platforms_without_candle_interval = frozenset((Platform.BITMEX, Platform.COINSUPER))
+_platforms_with_zero_candle_volume = frozenset((Platform.OKEX, Platform.BITMEX))
+_platforms_with_zero_candle_trades_count = frozenset((Platform.BINANCE, Platform.BITMEX))
+_platforms_with_zero_ticker_price = frozenset((Platform.OKEX, Platform.BILAXY, Platform.BITMEX))
+_platforms_without_user_order_id = frozenset((Platform.OKEX, Platform.BITTREX, Platform.COINSUPER,
+                                              Platform.BILAXY))
+_platforms_without_order_type = frozenset((Platform.BILAXY, Platform.COINSUPER))
+_stop_market_order_types = frozenset((OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET))
+_market_order_types = _stop_market_order_types | {OrderType.MARKET}
+# (C-level attribute access for bulk scans of received items)
+_get_platform_id = attrgetter("platform_id")
+_get_symbol = attrgetter("symbol")
+_get_class = attrgetter("__class__")
+# (Returns (platform_id, symbol) tuple ready to be used as a key)
+_get_platform_id_and_symbol = attrgetter("platform_id", "symbol")
+
+
+def wait_for(value_or_callable, min_count=2, timeout_sec=10., event=None):
     # Wait for value is of "min_count" length or "timeout_sec" elapsed.
-    start_time = time.time()
+    # (event - optional threading.Event set by producer on new data to wake up at once)
+    # (Monotonic clock is not affected by system time adjustments)
+    start_time = time.monotonic()
+    deadline = start_time + timeout_sec if timeout_sec else None
     value, fun = (None, value_or_callable) if callable(value_or_callable) \
         else (value_or_callable, None)
+    sleep_sec = 0.001
     # print("\n### Waiting a list for min_count: %s%s or timeout_sec: %s" %
     #       (min_count, " or function is True" if fun else "", timeout_sec))
-    while not timeout_sec or time.time() - start_time < timeout_sec:
+    while deadline is None or time.monotonic() < deadline:
+        if event is not None:
+            # (Clear before checking, so data added after the check wakes us up)
+            event.clear()
         if fun:
             value = fun()
         if isinstance(value, bool):
             if value:
                 # print("\n### Result is true: %s in %s seconds" %
-                #       (value, time.time() - start_time))
+                #       (value, time.monotonic() - start_time))
                 return
         else:
             value_count = value if isinstance(value, int) else len(value)
             if value_count >= min_count:
                 print("\n### Count reached: %s of %s in %s seconds" %
-                      (value_count, min_count, time.time() - start_time))
+                      (value_count, min_count, time.monotonic() - start_time))
                 return
             # print(
             #     "\n### Sleep... current min_count: %s of %s, %s seconds passed. Value: %s"
-            #     % (value_count, min_count, time.time() - start_time, value))
-        time.sleep(min(1, timeout_sec / 10) if timeout_sec else 1)
+            #     % (value_count, min_count, time.monotonic() - start_time, value))
+        # (Exponential backoff: from 1 ms up to 100 ms between checks)
+        if event is not None:
+            event.wait(sleep_sec)
+        else:
+            time.sleep(sleep_sec)
+        sleep_sec = min(sleep_sec * 2, 0.1)
     print("\n### Time is out! (value)")
     raise Exception("Time is out!")
 
 
+@lru_cache(maxsize=256)
+def _get_item_classes(endpoints):
+    # (Tests use the same few endpoint tuples again and again)
+    return frozenset(ProtocolConverter.item_class_by_endpoint[endpoint] for endpoint in endpoints)
+
+
+def _iterate_platform_ids_and_symbols(platform_ids, symbols, is_strict_binding=False):
+    # (All combinations, or pairs by index if is_strict_binding)
+    if not is_strict_binding:
+        return itertools.product(platform_ids, symbols)
+    return zip(platform_ids, symbols)
+
+
 def wait_for_all(received_items,
                  item_classes=None,
                  symbols=None,
@@ -52,97 +112,217 @@ def wait_for_all(received_items,
                  timeout_sec=10,
                  is_check_all_received=False,
                  is_strict_binding=False,
-                 item_number=None):
-    def iterator(platform_ids, symbols, is_strict_binding=False):
-        if not is_strict_binding:
-            for platform_id in platform_ids:
-                for symbol in symbols:
-                    yield platform_id, symbol
-        else:
-            for platform_id, symbol in zip(platform_ids, symbols):
-                yield platform_id, symbol
-
+                 item_number=None,
+                 event=None):
     if received_items is None:
         logging.warning("received_items cannot be None!")
         return
+    # (Resolved once, not on each check)
+    get_received_items = received_items if callable(received_items) else lambda: received_items
+
+    # (Seen values are updated only from newly received items on each check,
+    # instead of scanning all received_items again and again)
+    item_classes_seen = set()
+    item_classes_by_platform_id_and_symbol = defaultdict(set)
+    count_by_platform_id_and_symbol = Counter()
+    count_by_platform_id = Counter()
+    count_by_symbol = Counter()
+    last_index = 0
+
+    def update():
+        nonlocal last_index
+        new_items = get_received_items()[last_index:]
+        last_index += len(new_items)
+        new_platform_ids = list(map(_get_platform_id, new_items))
+        new_symbols = list(map(_get_symbol, new_items))
+        new_item_classes = list(map(_get_class, new_items))
+        new_platform_ids_and_symbols = list(zip(new_platform_ids, new_symbols))
+        # (Counter.update() counts in C; seen platform_ids and symbols are the counters' keys)
+        count_by_platform_id.update(new_platform_ids)
+        count_by_symbol.update(new_symbols)
+        count_by_platform_id_and_symbol.update(new_platform_ids_and_symbols)
+        item_classes_seen.update(new_item_classes)
+        for platform_id_and_symbol, item_class in zip(new_platform_ids_and_symbols,
+                                                      new_item_classes):
+            item_classes_by_platform_id_and_symbol[platform_id_and_symbol].add(item_class)
+
+    def wait_until(condition, timeout_sec):
+        def check():
+            update()
+            return condition()
+
+        wait_for(check, timeout_sec=timeout_sec, event=event)
+
     if is_check_all_received and item_classes and platform_ids and symbols:
         item_classes = set(item_classes)
-        for platform_id, symbol in iterator(platform_ids, symbols,
-                                            is_strict_binding):
+        for platform_id, symbol in _iterate_platform_ids_and_symbols(platform_ids, symbols,
+                                                                     is_strict_binding):
             logging.debug(
                 "\n##### Waiting for item classes (endpoints): %s for platform_id: %s symbol: %s",
                 item_classes, platform_id, symbol)
-            wait_for(lambda: {
-                i.__class__
-                for i in (received_items()
-                          if callable(received_items) else received_items)
-                if i.platform_id == platform_id and i.symbol == symbol
-            } >= item_classes,
-                     timeout_sec=timeout_sec)
+            key = (platform_id, symbol)
+            wait_until(lambda: item_classes_by_platform_id_and_symbol[key] >= item_classes,
+                       timeout_sec)
             if item_number is not None:
                 logging.debug("Waiting for %s items", item_number)
-
-                def count(platform_id, symbol, cnt):
-                    found_items = 0
-                    for i in received_items:
-                        if i.platform_id == platform_id and i.symbol == symbol:
-                            found_items += 1
-                    return found_items >= cnt
-
-                wait_for(lambda: count(platform_id, symbol, item_number),
-                         timeout_sec)
+                wait_until(lambda: count_by_platform_id_and_symbol[key] >= item_number,
+                           timeout_sec)
     else:
-        if platform_ids:
-            # print("\n##### Waiting for all platform_ids:", platform_ids)
-            wait_for(lambda: {
-                i.platform_id
-                for i in (received_items()
-                          if callable(received_items) else received_items)
-            } == set(platform_ids),
-                     timeout_sec=timeout_sec / 2)
-            if item_number is not None:
-                logging.debug("Waiting for %s items", item_number)
-
-                def count(platform_id, cnt):
-                    found_items = 0
-                    for i in received_items:
-                        if i.platform_id == platform_id:
-                            found_items += 1
-                    return found_items >= cnt
-
-                for platform_id in platform_ids:
-                    wait_for(lambda: count(platform_id, item_number),
-                             timeout_sec)
-        if symbols:
-            # print("\n##### Waiting for all symbols:", symbols)
-            wait_for(lambda: {
-                i.symbol
-                for i in (received_items()
-                          if callable(received_items) else received_items)
-            } == set(symbols),
-                     timeout_sec=timeout_sec / 2)
-            if item_number is not None:
-                logging.debug("Waiting for %s items", item_number)
-
-                def count(symbol, cnt):
-                    found_items = 0
-                    for i in received_items:
-                        if i.symbol == symbol:
-                            found_items += 1
-                    return found_items >= cnt
-
-                for symbol in symbols:
-                    wait_for(lambda: count(symbol, item_number), timeout_sec)
-        if item_classes:
-            # print("\n##### Waiting for item classes (endpoints):",
-            #       item_classes)
-
-            wait_for(lambda: {
-                i.__class__
-                for i in (received_items()
-                          if callable(received_items) else received_items)
-            } == set(item_classes),
-                     timeout_sec=timeout_sec)
+        # (One wait with a shared deadline for all seen sets instead of serial waits)
+        platform_ids_set = set(platform_ids) if platform_ids else None
+        symbols_set = set(symbols) if symbols else None
+        item_classes_set = set(item_classes) if item_classes else None
+        # print("\n##### Waiting for all platform_ids: %s, symbols: %s, item classes: %s" %
+        #       (platform_ids_set, symbols_set, item_classes_set))
+        wait_until(lambda: (not platform_ids_set or count_by_platform_id.keys() == platform_ids_set) and
+                           (not symbols_set or count_by_symbol.keys() == symbols_set) and
+                           (not item_classes_set or item_classes_seen == item_classes_set),
+                   timeout_sec)
+        if item_number is not None:
+            logging.debug("Waiting for %s items", item_number)
+            if platform_ids:
+                wait_until(lambda: all(count_by_platform_id[platform_id] >= item_number
+                                       for platform_id in platform_ids), timeout_sec)
+            if symbols:
+                wait_until(lambda: all(count_by_symbol[symbol] >= item_number
+                                       for symbol in symbols), timeout_sec)
+
+
+def _to_set(items):
+    return items if isinstance(items, (set, frozenset)) else set(items)
+
+
+def _get_validation_key(name, item, args):
+    return (name, id(item), *(tuple(arg) if isinstance(arg, (list, set)) else arg for arg in args))
+
+
+def _get_items_to_validate(items):
+    if not _is_fast_assert or len(items) <= 2:
+        return items
+    return items[0], items[-1]
+
+
+def _is_item_valid(item, testing_symbol_or_symbols=None, platform_id=None,
+                   is_with_item_id=True, is_with_timestamp=True):
+    # (Same checks as in _assert_item_is_valid(), without assert calls)
+    if not isinstance(item, ItemObject) or not isinstance(item.symbol, str) or \
+            not _symbol_re.search(item.symbol):
+        return False
+    if hasattr(item, "platform_ids"):
+        if not all(isinstance(pl_id, int) for pl_id in item.platform_ids):
+            return False
+    elif not isinstance(item.platform_id, int):
+        return False
+    if item.platform_id is None or (platform_id and item.platform_id != platform_id):
+        return False
+    if is_with_timestamp and (not isinstance(item.timestamp, _timestamp_types) or
+                              item.timestamp <= (10000000000 if item.is_milliseconds else 1000000000)):
+        return False
+    if is_with_item_id and (not isinstance(item.item_id, str) or not item.item_id):
+        return False
+    if testing_symbol_or_symbols:
+        if item.symbol != item.symbol.upper():
+            return False
+        if item.symbol != testing_symbol_or_symbols if isinstance(testing_symbol_or_symbols, str) \
+                else item.symbol not in testing_symbol_or_symbols:
+            return False
+    return True
+
+
+def _is_trade_valid(trade, testing_symbol_or_symbols=None, platform_id=None):
+    # (Same checks as in APITestCase.assertTradeIsValid(), without assert calls)
+    return isinstance(trade, Trade) and \
+        _is_item_valid(trade, testing_symbol_or_symbols, platform_id, True, True) and \
+        isinstance(trade.amount, Decimal) and isinstance(trade.price, Decimal) and \
+        trade.amount > 0 and trade.price > 0 and \
+        (trade.direction is None or isinstance(trade.direction, int) and trade.direction in _direction_values)
+
+
+def _is_order_book_item_valid(item, testing_symbol_or_symbols=None, platform_id=None):
+    # (Same checks as in APITestCase.assertOrderBookItemIsValid(), without assert calls)
+    return isinstance(item, OrderBookItem) and \
+        _is_item_valid(item, testing_symbol_or_symbols, platform_id, False, False) and \
+        _is_order_book_item_values_valid(item)
+
+
+def _is_order_book_item_of_order_book_valid(item, order_book):
+    # (Items get platform_id and symbol from their order book, which is already validated,
+    # so only comparing them with the book's ones is needed besides item's own values)
+    return isinstance(item, OrderBookItem) and \
+        item.platform_id == order_book.platform_id and item.symbol == order_book.symbol and \
+        _is_order_book_item_values_valid(item)
+
+
+def _is_order_book_item_values_valid(item):
+    if not isinstance(item.amount, Decimal) or not isinstance(item.price, Decimal) or \
+            item.amount < 0 or item.price <= 0:
+        return False
+    if item.direction is not None and (not isinstance(item.direction, int) or
+                                       item.direction not in _order_book_direction_values):
+        return False
+    if item.orders_count is not None and (not isinstance(item.orders_count, int) or
+                                          item.orders_count < 0):
+        return False
+    return True
+
+
+def _assert_item_is_valid(test_case,
+                          item,
+                          testing_symbol_or_symbols=None,
+                          platform_id=None,
+                          is_with_item_id=True,
+                          is_with_timestamp=True):
+    # (Plain function, so other asserts call it directly, not through APITestCase.
+    # Bound methods below are looked up once as they are called many times for each item)
+    assertIsNotNone = test_case.assertIsNotNone
+    assertIsInstance = test_case.assertIsInstance
+
+    assertIsNotNone(item)
+    assertIsInstance(item, ItemObject, item)
+
+    # Not empty
+    assertIsNotNone(item.platform_id)
+    assertIsNotNone(item.symbol)
+    if is_with_timestamp:
+        assertIsNotNone(item.timestamp)
+    if is_with_item_id:
+        assertIsNotNone(
+            item.item_id
+        )  # trade_id: binance, bitfinex - int converted to str; bitmex - str
+
+    # Type
+    if hasattr(item, "platform_ids"):
+        for pl_id in item.platform_ids:
+            assertIsInstance(pl_id, int)
+    else:
+        assertIsInstance(item.platform_id, int)
+    assertIsInstance(item.symbol, str)
+    test_case.assertRegex(item.symbol, _symbol_re, "Wrong symbol format!"
+                          )  # to prevent "ETH/BTC", "ethbtc"-like formats
+    if is_with_timestamp:
+        test_case.assertTrue(isinstance(item.timestamp, _timestamp_types))
+    if is_with_item_id:
+        assertIsInstance(item.item_id, str)
+
+    # Value
+    # (assertEqual() dispatches by type on each call, so it's called only on mismatch, to report it)
+    if platform_id and item.platform_id != platform_id:
+        test_case.assertEqual(item.platform_id, platform_id)
+    if is_with_timestamp:
+        test_case.assertGreater(item.timestamp, 1000000000)
+        if item.is_milliseconds:
+            test_case.assertGreater(item.timestamp, 10000000000)
+    if testing_symbol_or_symbols:
+        symbol_upper = item.symbol.upper()
+        if item.symbol != symbol_upper:
+            test_case.assertEqual(item.symbol, symbol_upper)
+        if isinstance(testing_symbol_or_symbols, str):
+            if item.symbol != testing_symbol_or_symbols:
+                test_case.assertEqual(item.symbol, testing_symbol_or_symbols)
+        else:
+            test_case.assertIn(item.symbol, testing_symbol_or_symbols)
+    if is_with_item_id:
+        test_case.assertTrue(item.item_id, "Empty item_id")
 
 
 class APITestCase(TestCase):
@@ -156,48 +336,8 @@ class APITestCase(TestCase):
                           platform_id=None,
                           is_with_item_id=True,
                           is_with_timestamp=True):
-        self.assertIsNotNone(item)
-        self.assertIsInstance(item, ItemObject, item)
-
-        # Not empty
-        self.assertIsNotNone(item.platform_id)
-        self.assertIsNotNone(item.symbol)
-        if is_with_timestamp:
-            self.assertIsNotNone(item.timestamp)
-        if is_with_item_id:
-            self.assertIsNotNone(
-                item.item_id
-            )  # trade_id: binance, bitfinex - int converted to str; bitmex - str
-
-        # Type
-        if hasattr(item, "platform_ids"):
-            for pl_id in item.platform_ids:
-                self.assertIsInstance(pl_id, int)
-        else:
-            self.assertIsInstance(item.platform_id, int)
-        self.assertIsInstance(item.symbol, str)
-        self.assertRegex(item.symbol, "[A-Z]+", "Wrong symbol format!"
-                         )  # to prevent "ETH/BTC", "ethbtc"-like formats
-        if is_with_timestamp:
-            self.assertTrue(isinstance(item.timestamp, (float, int)))
-        if is_with_item_id:
-            self.assertIsInstance(item.item_id, str)
-
-        # Value
-        if platform_id:
-            self.assertEqual(item.platform_id, platform_id)
-        if is_with_timestamp:
-            self.assertGreater(item.timestamp, 1000000000)
-            if item.is_milliseconds:
-                self.assertGreater(item.timestamp, 10000000000)
-        if testing_symbol_or_symbols:
-            self.assertEqual(item.symbol, item.symbol.upper())
-            if isinstance(testing_symbol_or_symbols, str):
-                self.assertEqual(item.symbol, testing_symbol_or_symbols)
-            else:
-                self.assertIn(item.symbol, testing_symbol_or_symbols)
-        if is_with_item_id:
-            self.assertGreater(len(str(item.item_id)), 0)
+        _assert_item_is_valid(self, item, testing_symbol_or_symbols, platform_id,
+                              is_with_item_id, is_with_timestamp)
 
     def assertTradeIsValid(self,
                            trade,
@@ -206,26 +346,45 @@ class APITestCase(TestCase):
                            is_dict=False):
         if is_dict and trade:
             trade = Trade(**trade)
-        APITestCase.assertItemIsValid(self, trade, testing_symbol_or_symbols,
-                                      platform_id, True)
-        self.assertIsInstance(trade, Trade)
+        elif APITestCase._isValidated(self, "trade", trade, testing_symbol_or_symbols, platform_id):
+            return
+        assertIsInstance = self.assertIsInstance
+        assertIsNotNone = self.assertIsNotNone
+        assertGreater = self.assertGreater
+
+        _assert_item_is_valid(self, trade, testing_symbol_or_symbols,
+                              platform_id, True)
+        assertIsInstance(trade, Trade)
 
         # Not empty
-        self.assertIsNotNone(trade.amount)
-        self.assertIsNotNone(trade.price)
+        assertIsNotNone(trade.amount)
+        assertIsNotNone(trade.price)
         # self.assertIsNotNone(trade.direction)
 
         # Type
-        self.assertIsInstance(trade.amount, Decimal)
-        self.assertIsInstance(trade.price, Decimal)
+        assertIsInstance(trade.amount, Decimal)
+        assertIsInstance(trade.price, Decimal)
         if trade.direction is not None:
-            self.assertIsInstance(trade.direction, int)
+            assertIsInstance(trade.direction, int)
 
         # Value
-        self.assertGreater(trade.amount, 0)
-        self.assertGreater(trade.price, 0)
+        assertGreater(trade.amount, 0)
+        assertGreater(trade.price, 0)
         if trade.direction is not None:
-            self.assertIn(trade.direction, Direction.name_by_value)
+            self.assertIn(trade.direction, _direction_values)
+
+        APITestCase._setValidated(self, "trade", trade, testing_symbol_or_symbols, platform_id)
+
+    def assertTradesAreValid(self,
+                             trades,
+                             testing_symbol_or_symbols=None,
+                             platform_id=None):
+        # (Same as assertTradeIsValid() for each trade, but with a plain pass first)
+        trades = _get_items_to_validate(trades)
+        if all(_is_trade_valid(trade, testing_symbol_or_symbols, platform_id) for trade in trades):
+            return
+        for trade in trades:
+            APITestCase.assertTradeIsValid(self, trade, testing_symbol_or_symbols, platform_id)
 
     def assertMyTradeIsValid(self,
                              my_trade,
@@ -268,11 +427,19 @@ class APITestCase(TestCase):
                             is_dict=False):
         if is_dict and candle:
             candle = Candle(**candle)
+        elif APITestCase._isValidated(self, "candle", candle, testing_symbol_or_symbols, platform_id):
+            return
+
+        assertIsInstance = self.assertIsInstance
+        assertGreater = self.assertGreater
+        assertIsNone = self.assertIsNone
+        assertEqual = self.assertEqual
+        assertGreaterEqual = self.assertGreaterEqual
 
-        APITestCase.assertItemIsValid(self, candle, testing_symbol_or_symbols,
-                                      platform_id, False)
+        _assert_item_is_valid(self, candle, testing_symbol_or_symbols,
+                              platform_id, False)
 
-        self.assertIsInstance(candle, Candle)
+        assertIsInstance(candle, Candle)
 
         # Not empty
         if candle.platform_id != Platform.BITMEX:
@@ -287,51 +454,48 @@ class APITestCase(TestCase):
 
         # Type
         if candle.platform_id != Platform.BITMEX:
-            self.assertIsInstance(candle.interval, str)
+            assertIsInstance(candle.interval, str)
         if candle.price_open is not None:
-            self.assertIsInstance(candle.price_open, Decimal)
-            self.assertIsInstance(candle.price_close, Decimal)
-            self.assertIsInstance(candle.price_high, Decimal)
-            self.assertIsInstance(candle.price_low, Decimal)
+            assertIsInstance(candle.price_open, Decimal)
+            assertIsInstance(candle.price_close, Decimal)
+            assertIsInstance(candle.price_high, Decimal)
+            assertIsInstance(candle.price_low, Decimal)
         if candle.volume is not None:
-            self.assertIsInstance(candle.volume, Decimal)
+            assertIsInstance(candle.volume, Decimal)
         if candle.trades_count is not None:
-            self.assertIsInstance(candle.trades_count, int)
+            assertIsInstance(candle.trades_count, int)
 
         # Value
-        if candle.platform_id not in [Platform.BITMEX, Platform.COINSUPER]:
-            self.assertIn(candle.interval, CandleInterval.ALL)
+        if candle.platform_id not in _platforms_without_candle_interval:
+            self.assertIn(candle.interval, _candle_intervals)
         if candle.price_open is not None:
-            self.assertGreater(candle.price_open, 0)
-            self.assertGreater(candle.price_close, 0)
-            self.assertGreater(candle.price_high, 0)
-            self.assertGreater(candle.price_low, 0)
+            assertGreater(candle.price_open, 0)
+            assertGreater(candle.price_close, 0)
+            assertGreater(candle.price_high, 0)
+            assertGreater(candle.price_low, 0)
         else:
-            self.assertIsNone(candle.price_open)
-            self.assertIsNone(candle.price_close)
-            self.assertIsNone(candle.price_high)
-            self.assertIsNone(candle.price_low)
+            assertIsNone(candle.price_open)
+            assertIsNone(candle.price_close)
+            assertIsNone(candle.price_high)
+            assertIsNone(candle.price_low)
         if candle.volume is not None:
             if candle.price_open is None:
-                self.assertEqual(candle.volume, 0)
-            elif candle.platform_id == Platform.OKEX:
-                self.assertGreaterEqual(candle.volume, 0)
+                assertEqual(candle.volume, 0)
+            elif candle.platform_id in _platforms_with_zero_candle_volume:
+                assertGreaterEqual(candle.volume, 0)
             else:
-                if candle.platform_id not in [Platform.BITMEX]:
-                    self.assertGreater(candle.volume, 0)
-                else:
-                    self.assertGreaterEqual(candle.volume, 0)
+                assertGreater(candle.volume, 0)
         if candle.trades_count is not None:
             if candle.price_open is None:
-                self.assertEqual(candle.trades_count, 0)
+                assertEqual(candle.trades_count, 0)
             else:
                 # binance indeed has zero-volumed candles
-                if candle.platform_id not in [
-                        Platform.BINANCE, Platform.BITMEX
-                ]:
-                    self.assertGreater(candle.trades_count, 0)
+                if candle.platform_id not in _platforms_with_zero_candle_trades_count:
+                    assertGreater(candle.trades_count, 0)
                 else:
-                    self.assertGreaterEqual(candle.trades_count, 0)
+                    assertGreaterEqual(candle.trades_count, 0)
+
+        APITestCase._setValidated(self, "candle", candle, testing_symbol_or_symbols, platform_id)
 
     def assertTickerIsValid(self,
                             ticker,
@@ -340,9 +504,11 @@ class APITestCase(TestCase):
                             is_dict=False):
         if is_dict and ticker:
             ticker = Ticker(**ticker)
+        elif APITestCase._isValidated(self, "ticker", ticker, testing_symbol_or_symbols, platform_id):
+            return
 
-        APITestCase.assertItemIsValid(self, ticker, testing_symbol_or_symbols,
-                                      platform_id, False, False)
+        _assert_item_is_valid(self, ticker, testing_symbol_or_symbols,
+                              platform_id, False, False)
 
         self.assertIsInstance(ticker, Ticker, ticker)
 
@@ -354,7 +520,7 @@ class APITestCase(TestCase):
         self.assertIsInstance(ticker.price, Decimal)
 
         # Value
-        if platform_id in [Platform.OKEX, Platform.BILAXY, Platform.BITMEX]:
+        if platform_id in _platforms_with_zero_ticker_price:
             # Okex send ticker with 0 price
             # For example LIGHT_BTC
             # Bilaxy send ticker with 0 price
@@ -364,6 +530,8 @@ class APITestCase(TestCase):
         else:
             self.assertGreater(ticker.price, 0)
 
+        APITestCase._setValidated(self, "ticker", ticker, testing_symbol_or_symbols, platform_id)
+
     def assertOrderBookIsValid(self,
                                order_book,
                                testing_symbol_or_symbols=None,
@@ -374,9 +542,9 @@ class APITestCase(TestCase):
             order_book = OrderBook(**order_book)
 
         # Assert order book
-        APITestCase.assertItemIsValid(self, order_book,
-                                      testing_symbol_or_symbols, platform_id,
-                                      False, False)
+        _assert_item_is_valid(self, order_book,
+                              testing_symbol_or_symbols, platform_id,
+                              False, False)
 
         self.assertIsInstance(order_book, OrderBook)
         self.assertIsNotNone(order_book.asks)
@@ -389,16 +557,22 @@ class APITestCase(TestCase):
         # # else:
         # #     self.assertGreater(len(order_book.asks), 0)
         # #     self.assertGreater(len(order_book.bids), 0)
+        if not order_book.asks and not order_book.bids:
+            # (Empty diff - no items to check)
+            return
 
         # Assert order book items
-        for item in order_book.asks:
-            APITestCase.assertOrderBookItemIsValid(self, item,
-                                                   testing_symbol_or_symbols,
-                                                   platform_id)
-        for item in order_book.bids:
-            APITestCase.assertOrderBookItemIsValid(self, item,
-                                                   testing_symbol_or_symbols,
-                                                   platform_id)
+        if all(_is_order_book_item_of_order_book_valid(item, order_book)
+               for item in itertools.chain(_get_items_to_validate(order_book.asks),
+                                           _get_items_to_validate(order_book.bids))):
+            return
+        # (Full asserts for all items to report the wrong one)
+        APITestCase.assertOrderBookItemsAreValid(self, order_book.asks,
+                                                 testing_symbol_or_symbols,
+                                                 platform_id)
+        APITestCase.assertOrderBookItemsAreValid(self, order_book.bids,
+                                                 testing_symbol_or_symbols,
+                                                 platform_id)
 
     def assertQuoteIsValid(self,
                            quote,
@@ -411,8 +585,8 @@ class APITestCase(TestCase):
             quote = Quote(**quote)
 
         # Assert order book
-        APITestCase.assertItemIsValid(self, quote, testing_symbol_or_symbols,
-                                      platform_id, False, False)
+        _assert_item_is_valid(self, quote, testing_symbol_or_symbols,
+                              platform_id, False, False)
 
         self.assertIsInstance(quote, Quote)
         self.assertIsNotNone(quote.bestask)
@@ -460,35 +634,60 @@ class APITestCase(TestCase):
                                    is_dict=False):
         if is_dict and order_book_item:
             order_book_item = OrderBookItem(**order_book_item)
+        elif APITestCase._isValidated(self, "order_book_item", order_book_item,
+                                      testing_symbol_or_symbols, platform_id):
+            return
+
+        assertIsInstance = self.assertIsInstance
+        assertIsNotNone = self.assertIsNotNone
+        assertGreaterEqual = self.assertGreaterEqual
 
-        APITestCase.assertItemIsValid(self, order_book_item,
-                                      testing_symbol_or_symbols, platform_id,
-                                      False, False)
+        _assert_item_is_valid(self, order_book_item,
+                              testing_symbol_or_symbols, platform_id,
+                              False, False)
 
-        self.assertIsInstance(order_book_item, OrderBookItem)
+        assertIsInstance(order_book_item, OrderBookItem)
 
         # Not empty
-        self.assertIsNotNone(order_book_item.amount, order_book_item)
-        self.assertIsNotNone(order_book_item.price, order_book_item)
+        assertIsNotNone(order_book_item.amount, order_book_item)
+        assertIsNotNone(order_book_item.price, order_book_item)
         # self.assertIsNotNone(order_book_item.direction)
         # self.assertIsNotNone(order_book_item.orders_count)
 
         # Type
-        self.assertIsInstance(order_book_item.amount, Decimal)
-        self.assertIsInstance(order_book_item.price, Decimal)
+        assertIsInstance(order_book_item.amount, Decimal)
+        assertIsInstance(order_book_item.price, Decimal)
         if order_book_item.direction is not None:
-            self.assertIsInstance(order_book_item.direction, int)
+            assertIsInstance(order_book_item.direction, int)
         if order_book_item.orders_count is not None:
-            self.assertIsInstance(order_book_item.orders_count, int)
+            assertIsInstance(order_book_item.orders_count, int)
 
         # Value
-        self.assertGreaterEqual(order_book_item.amount, 0)
+        assertGreaterEqual(order_book_item.amount, 0)
         self.assertGreater(order_book_item.price, 0)
         if order_book_item.direction is not None:
             self.assertIn(order_book_item.direction,
-                          OrderBookDirection.name_by_value)
+                          _order_book_direction_values)
         if order_book_item.orders_count is not None:
-            self.assertGreaterEqual(order_book_item.orders_count, 0)
+            assertGreaterEqual(order_book_item.orders_count, 0)
+
+        APITestCase._setValidated(self, "order_book_item", order_book_item,
+                                  testing_symbol_or_symbols, platform_id)
+
+    def assertOrderBookItemsAreValid(self,
+                                     order_book_items,
+                                     testing_symbol_or_symbols=None,
+                                     platform_id=None):
+        # (One plain pass over all items instead of a dozen assert calls per item.
+        # Asserts are called only if some item is invalid, to report it)
+        order_book_items = _get_items_to_validate(order_book_items)
+        if all(_is_order_book_item_valid(item, testing_symbol_or_symbols, platform_id)
+               for item in order_book_items):
+            return
+        for item in order_book_items:
+            APITestCase.assertOrderBookItemIsValid(self, item,
+                                                   testing_symbol_or_symbols,
+                                                   platform_id)
 
     def assertAccountIsValid(self, account, platform_id=None, is_dict=False, has_timestamp=True):
         if is_dict and account:
@@ -503,7 +702,7 @@ class APITestCase(TestCase):
 
         # Type
         self.assertIsInstance(account.platform_id, int)
-        self.assertIsInstance(account.timestamp, (int, float))
+        self.assertIsInstance(account.timestamp, _timestamp_types)
         # self.assertIsInstance(account.balances, list)
 
         # Value
@@ -581,7 +780,7 @@ class APITestCase(TestCase):
         if platform_id:
             self.assertEqual(transaction.platform_id, platform_id)
         self.assertEqual(transaction.symbol, transaction.symbol.upper())
-        self.assertIn(transaction.transaction_type, TransactionType.ALL)
+        self.assertIn(transaction.transaction_type, _transaction_types)
 
     def assertOrderIsValid(self,
                            order,
@@ -591,71 +790,65 @@ class APITestCase(TestCase):
         if is_dict and order:
             order = Order(**order)
 
-        APITestCase.assertItemIsValid(self, order, testing_symbol_or_symbols,
-                                      platform_id, True)
-        self.assertIsInstance(order, Order)
+        assertIsInstance = self.assertIsInstance
+        assertIsNotNone = self.assertIsNotNone
+        assertIn = self.assertIn
+        assertGreater = self.assertGreater
+        assertEqual = self.assertEqual
+
+        _assert_item_is_valid(self, order, testing_symbol_or_symbols,
+                              platform_id, True)
+        assertIsInstance(order, Order)
 
         # Not empty
-        if platform_id not in [
-                Platform.OKEX, Platform.BITTREX, Platform.COINSUPER,
-                Platform.BILAXY
-        ]:
+        if platform_id not in _platforms_without_user_order_id:
             # Okex, Bittrex, Coinsuper api doesn't fill the field 'user_order_id'
-            self.assertIsNotNone(order.user_order_id)
-        if platform_id not in [Platform.BILAXY, Platform.COINSUPER]:
+            assertIsNotNone(order.user_order_id)
+        if platform_id not in _platforms_without_order_type:
             # Sometimes None in Coinsuper
-            self.assertIsNotNone(order.order_type)
+            assertIsNotNone(order.order_type)
         if order.order_type == OrderType.MARKET:
             # (None: Binance,)
             # (Not None: BitMEX,)
             # self.assertIsNone(order.price)
             pass
-        elif order.order_type in [
-                OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET
-        ]:
-            self.assertIsNotNone(order.price_stop)
+        elif order.order_type in _stop_market_order_types:
+            assertIsNotNone(order.price_stop)
         else:
-            self.assertIsNotNone(order.price)
+            assertIsNotNone(order.price)
         if order.platform_id not in (
                 Platform.BITMEX,
                 Platform.COINSUPER):  # (Sometimes is None in BitMEX)
-            self.assertIsNotNone(order.amount_original)
-            self.assertIsNotNone(order.amount_executed)
+            assertIsNotNone(order.amount_original)
+            assertIsNotNone(order.amount_executed)
         if order.platform_id != Platform.BITMEX:  # (Sometimes is None in BitMEX)
-            self.assertIsNotNone(order.direction)
-        self.assertIsNotNone(order.order_status)
+            assertIsNotNone(order.direction)
+        assertIsNotNone(order.order_status)
 
         # Type
         # Not empty
-        if platform_id not in [
-                Platform.OKEX, Platform.BITTREX, Platform.COINSUPER,
-                Platform.BILAXY
-        ]:
+        if platform_id not in _platforms_without_user_order_id:
             # Okex, Bittrex, Coinsuper api doesn't fill the field 'user_order_id'
-            self.assertIsInstance(order.user_order_id, str)
+            assertIsInstance(order.user_order_id, str)
         if platform_id is not Platform.COINSUPER:
             # `cause sometimes platform return null in order_type
-            self.assertIsInstance(order.order_type, int)
-        if not (order.order_type == OrderType.MARKET or (order.order_type in [
-                OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_MARKET
-        ] and order.price is None)):
-            self.assertIsInstance(order.price, Decimal)
+            assertIsInstance(order.order_type, int)
+        if not (order.order_type == OrderType.MARKET or
+                order.order_type in _stop_market_order_types and order.price is None):
+            assertIsInstance(order.price, Decimal)
         if order.amount_original is not None:
-            self.assertIsInstance(order.amount_original, Decimal)
+            assertIsInstance(order.amount_original, Decimal)
         if order.amount_executed is not None:
-            self.assertIsInstance(order.amount_executed, Decimal)
+            assertIsInstance(order.amount_executed, Decimal)
         if order.direction is not None:
-            self.assertIsInstance(order.direction, int)
-        self.assertIsInstance(order.order_status, int)
+            assertIsInstance(order.direction, int)
+        assertIsInstance(order.order_status, int)
 
         # Value
         if platform_id is not Platform.COINSUPER:
             # `cause sometimes platform return null in order_type
-            self.assertIn(order.order_type, OrderType.name_by_value)
-        if order.order_type in [
-                OrderType.MARKET, OrderType.TAKE_PROFIT_MARKET,
-                OrderType.STOP_MARKET
-        ]:
+            assertIn(order.order_type, _order_type_values)
+        if order.order_type in _market_order_types:
             # # For market order, price may vary, so price can be 0
             # # self.assertGreaterEqual(order.price, 0, order)
             # self.assertIsNone(order.price)
@@ -663,38 +856,36 @@ class APITestCase(TestCase):
         else:
             if not (platform_id == Platform.COINSUPER
                     or order.order_type is None):
-                self.assertGreater(order.price, 0, order)
+                assertGreater(order.price, 0, order)
         if order.amount_original is not None:
-            self.assertGreater(order.amount_original, 0)
+            assertGreater(order.amount_original, 0)
         if order.amount_executed is not None:
             self.assertGreaterEqual(order.amount_executed, 0)
         if order.direction is not None:
-            self.assertIn(order.direction, Direction.name_by_value)
-        self.assertIn(order.order_status, OrderStatus.name_by_value)
+            assertIn(order.direction, _direction_values)
+        assertIn(order.order_status, _order_status_values)
 
         # Check some properties (getters)
         if order.amount_original is not None:
             if order.is_new:
-                self.assertGreater(order.amount_original, 0)
-                self.assertEqual(order.amount_executed, 0)
+                assertGreater(order.amount_original, 0)
+                assertEqual(order.amount_executed, 0)
             elif order.is_partially_filled:
-                self.assertGreater(order.amount_original, 0)
-                self.assertGreater(order.amount_executed, 0)
-                self.assertGreater(order.amount_original,
-                                   order.amount_executed)
+                assertGreater(order.amount_original, 0)
+                assertGreater(order.amount_executed, 0)
+                assertGreater(order.amount_original, order.amount_executed)
             if order.is_filled:
-                self.assertGreater(order.amount_original, 0)
-                self.assertEqual(order.amount_original, order.amount_executed)
+                assertGreater(order.amount_original, 0)
+                assertEqual(order.amount_original, order.amount_executed)
 
             if order.amount_original is not None and order.amount_executed is not None:
-                self.assertEqual(order.amount_original,
-                                 order.amount_executed + order.amount_left)
+                assertEqual(order.amount_original, order.amount_executed + order.amount_left)
                 self.assertLessEqual(
                     order.is_new + order.is_partially_filled + order.is_filled,
                     1)
 
             # Check consistency (state properties)
-            self.assertEqual(order.is_open + order.is_closed, 1)
+            assertEqual(order.is_open + order.is_closed, 1)
 
     def assertPositionIsValid(self,
                               position,
@@ -727,14 +918,16 @@ class APITestCase(TestCase):
         # Value
         if platform_id:
             self.assertEqual(position.platform_id, platform_id)
-        self.assertEqual(position.symbol, position.symbol.upper())
-        if testing_symbol_or_symbols:
-            self.assertEqual(position.symbol,
-                             testing_symbol_or_symbols.upper())
+        symbol_upper = position.symbol.upper()
+        if position.symbol != symbol_upper:
+            self.assertEqual(position.symbol, symbol_upper)
+        if testing_symbol_or_symbols and testing_symbol_or_symbols != symbol_upper:
+            # (Upper-cased only if differs, as testing symbols are usually upper already)
+            self.assertEqual(symbol_upper, testing_symbol_or_symbols.upper())
         # self.assertGreaterEqual(position.amount, 0)
         if position.direction is not None:
-            self.assertIn(position.direction, Direction.name_by_value)
-            self.assertEqual(position.is_buy + position.is_sell, 1)
+            self.assertIn(position.direction, _direction_values)
+            self.assertTrue(position.is_buy ^ position.is_sell)
 
     assert_by_item_class = {
         Trade: assertTradeIsValid,
@@ -757,9 +950,9 @@ class APITestCase(TestCase):
                              is_check_all_received=False,
                              is_exact=False,
                              is_strict_binding=False,
-                             item_number=None):
-        item_classes = tuple(ProtocolConverter.item_class_by_endpoint[endpoint]
-                             for endpoint in endpoints) if endpoints else None
+                             item_number=None,
+                             event=None):
+        item_classes = _get_item_classes(tuple(endpoints)) if endpoints else None
 
         # Wait
         # # Needed at least 2 items (if the 1st and the next items parsed differently)
@@ -771,7 +964,8 @@ class APITestCase(TestCase):
                      timeout_sec=50,
                      is_check_all_received=is_check_all_received,
                      is_strict_binding=is_strict_binding,
-                     item_number=item_number)
+                     item_number=item_number,
+                     event=event)
         APITestCase.assertResults(self, received_items, endpoints, symbols,
                                   platform_ids, client, is_check_all_received,
                                   is_exact, is_strict_binding)
@@ -785,69 +979,85 @@ class APITestCase(TestCase):
                       is_check_all_received=False,
                       is_exact=False,
                       is_strict_binding=False):
-        def iterator(platform_ids, symbols, is_strict_binding=False):
-            if not is_strict_binding:
-                for platform_id in platform_ids:
-                    for symbol in symbols:
-                        yield platform_id, symbol
-            else:
-                for platform_id, symbol in zip(platform_ids, symbols):
-                    yield platform_id, symbol
-
         if callable(received_items):
             received_items = received_items()
         # print("\n\nassertResults received_items:", received_items)
 
-        item_classes = tuple(ProtocolConverter.item_class_by_endpoint[endpoint]
-                             for endpoint in endpoints) if endpoints else None
+        item_classes = _get_item_classes(tuple(endpoints)) if endpoints else None
 
-        # Assert not empty
         self.assertIsNotNone(received_items)
-        self.assertGreaterEqual(len(received_items), 1)
 
         # Assert each item
+        # (Received classes are grouped in the same pass, not rescanned for each combination.
+        # As the pass is the only one, received_items given here directly may be any iterable.
+        # waitAndAssertResults() still needs a list, as wait_for_all() slices it)
+        items_count = 0
+        item_classes_by_platform_id_and_symbol = defaultdict(set)
+        get_assert_fun = APITestCase.assert_by_item_class.get
+        # todo refactor removing "client" out of here
+        use_milliseconds = client.use_milliseconds if client else None
         for item in received_items:
-            # todo refactor removing "client" out of here
-            if client:
-                self.assertEqual(client.use_milliseconds, item.is_milliseconds)
+            items_count += 1
+            # (assertEqual() is called only on mismatch, to report it)
+            if client and item.is_milliseconds != use_milliseconds:
+                self.assertEqual(use_milliseconds, item.is_milliseconds)
 
-            assertIsValidFun = APITestCase.assert_by_item_class.get(
-                item.__class__)
+            item_class = item.__class__
+            assertIsValidFun = get_assert_fun(item_class)
             if assertIsValidFun:
                 assertIsValidFun(self, item)
+            item_classes_by_platform_id_and_symbol[_get_platform_id_and_symbol(item)].add(item_class)
+
+        # Assert not empty
+        self.assertGreater(items_count, 0, "No items received")
+        # (A consumed iterator would be shown empty, so grouped classes are shown instead)
+        msg = received_items if isinstance(received_items, (list, tuple)) \
+            else dict(item_classes_by_platform_id_and_symbol)
 
         # Assert at least one item for each defined param is received,
         # and there is no item which is not expected by these params
         if item_classes:
             APITestCase._assertMatched(self,
-                                       {i.__class__
-                                        for i in received_items}, item_classes,
-                                       is_exact, received_items)
+                                       set().union(*item_classes_by_platform_id_and_symbol.values()),
+                                       item_classes, is_exact, msg)
         if platform_ids:
             APITestCase._assertMatched(self,
-                                       {i.platform_id
-                                        for i in received_items}, platform_ids,
-                                       is_exact, received_items)
+                                       {platform_id for platform_id, _ in item_classes_by_platform_id_and_symbol},
+                                       platform_ids, is_exact, msg)
         if symbols:
             APITestCase._assertMatched(self,
-                                       {i.symbol
-                                        for i in received_items}, symbols,
-                                       is_exact, received_items)
+                                       {symbol for _, symbol in item_classes_by_platform_id_and_symbol},
+                                       symbols, is_exact, msg)
 
         # Assert all expected items are received:
         # at least one item of each endpoint for each platform_id & symbol combination
         if is_check_all_received and platform_ids and symbols:
             # Assert all endpoints, platforms and symbols subscribed
-            for platform_id, symbol in iterator(platform_ids, symbols,
-                                                is_strict_binding):
-                received_item_classes = {
-                    i.__class__
-                    for i in received_items
-                    if i.platform_id == platform_id and i.symbol == symbol
-                }
+            for platform_id, symbol in _iterate_platform_ids_and_symbols(platform_ids, symbols,
+                                                                         is_strict_binding):
+                received_item_classes = item_classes_by_platform_id_and_symbol.get(
+                    (platform_id, symbol), set())
                 APITestCase._assertMatched(self, received_item_classes,
-                                           item_classes, is_exact,
-                                           received_items)
+                                           item_classes, is_exact, msg)
+
+    def _isValidated(self, name, item, *args):
+        # (Each item is validated only once per test by the same assert method with the
+        # same args, unless its attributes have changed since it passed)
+        validated_item_by_key = self.__dict__.get("_validated_item_by_key")
+        if not validated_item_by_key:
+            return False
+        validated = validated_item_by_key.get(_get_validation_key(name, item, args))
+        return validated is not None and validated[1] == vars(item)
+
+    def _setValidated(self, name, item, *args):
+        # (Called after all asserts passed, so failed items are checked again)
+        validated_item_by_key = self.__dict__.get("_validated_item_by_key")
+        if validated_item_by_key is None:
+            validated_item_by_key = self._validated_item_by_key = {}
+            self.addCleanup(validated_item_by_key.clear)
+        # (Item is stored to keep its id() from being reused during the test,
+        # and a copy of its attributes to see whether it was changed after that)
+        validated_item_by_key[_get_validation_key(name, item, args)] = item, dict(vars(item))
 
     def _assertMatched(self,
                        received_items,
@@ -856,13 +1066,15 @@ class APITestCase(TestCase):
                        msg=None):
         # If is_exact, check all unique expected_items == unique received_items
         # If not is_exact, check all unique expected_items are in unique received_items
-        if not expected_items:
+        if not expected_items or received_items is expected_items:
+            return
+        # (Sets are used as is, not copied on each call)
+        received_items = _to_set(received_items)
+        expected_items = _to_set(expected_items)
+        # (Plain comparison first, asserts are only to report a mismatch)
+        if received_items == expected_items or not is_exact and received_items >= expected_items:
             return
         if is_exact:
-            self.assertEqual(set(received_items), set(expected_items), msg)
+            self.assertSetEqual(received_items, expected_items, msg)
         else:
-            self.assertGreaterEqual(set(received_items), set(expected_items),
-                                    msg)
-            # (same)
-            self.assertTrue(
-                set(received_items).issuperset(set(expected_items)), msg)
+            self.assertGreaterEqual(received_items, expected_items, msg)
@@ -1,9 +1,11 @@
 import unittest
+from collections import namedtuple
 from decimal import Decimal
+from enum import Enum
 from unittest import TestCase
 
-from hyperquant.api import Platform, ParamName, convert_items_to_dict, item_format_by_endpoint, Endpoint
-from hyperquant.clients import Trade
+from hyperquant.api import ParamName, convert_items_to_dict, item_format_by_endpoint, Endpoint
+from hyperquant.clients import ItemObject, Trade
 from hyperquant.utils import dict_util
 from hyperquant.utils.dict_util import check_is_sub_data
 
@@ -71,6 +73,14 @@ class TestDictUtil(TestCase):
         result = dict_util.group_items(item_dicts, [ParamName.PLATFORM_ID, ParamName.SYMBOL])
         self.assertEqual(result, expected_dicts)
 
+        # (iterator)
+        result = dict_util.group_items(iter(items), [ParamName.PLATFORM_ID, ParamName.SYMBOL])
+        self.assertEqual(result, expected)
+
+        # (mixed dicts and objects)
+        result = dict_util.group_items([item_dicts[0], items[1]], [ParamName.PLATFORM_ID, ParamName.SYMBOL])
+        self.assertEqual(result, {1: {"BTCETH": [item_dicts[0]]}, 2: {"BTCETH": [items[1]]}})
+
         # Empty
         result = dict_util.group_items(None, None)
         self.assertEqual(result, None)
@@ -105,6 +115,13 @@ class TestDictUtil(TestCase):
         result = dict_util.filter_keys(input, input)
         self.assertEqual(result, input)
 
+        # (iterables with attributes)
+        result = dict_util.filter_keys(input, namedtuple("Temp", "a b e")(5, 6, 7))
+        self.assertEqual(result, expected)
+
+        result = dict_util.filter_keys(expected, Enum("Temp", "a b e"))
+        self.assertEqual(result, expected)
+
         # Empty
         result = dict_util.filter_keys(input, [])
         self.assertEqual(result, {})
@@ -175,6 +192,10 @@ class TestDictUtil(TestCase):
         #  (change order)
         self.assertTrue(check_is_sub_data([("a", 1), ["b", 2], {3, 4}, {"c": 5}],
                                           [{"c": 5}, ("a", 1), {3, 4}]))
+        # (items equal by item_id, but hashed with timestamp)
+        item1, item2 = ItemObject(1, "BTCETH", 1000011, "1"), ItemObject(1, "BTCETH", 1000012, "1")
+        item3 = ItemObject(1, "BTCETH", 1000013, "3")
+        self.assertTrue(check_is_sub_data([item1, item3], [item3, item2]))
         # (no need as previous is also True)
         # self.assertTrue(check_is_sub_data([("a", 1), ["b", 2], {3, 4}, {"c": 5}],
         #                                   reversed([("a", 1), {3, 4}, {"c": 5}]), False))
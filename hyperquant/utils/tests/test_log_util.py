@@ -6,7 +6,7 @@ from hyperquant.utils.log_util import protect_secret_data
 class TestLogUtil(TestCase):
 
     def test_protect_secret_data(self):
-        not_changing_data = [123, "ddd", [1, 2], (1, 2), {1, 2}, {"a": 2}, None, 0, ""]
+        not_changing_data = [123, "ddd", [1, 2], (1, 2), {1, 2}, {"a": 2}, {1: "x"}, None, 0, ""]
 
         for item in not_changing_data:
             self.assertEqual(protect_secret_data(item), item)
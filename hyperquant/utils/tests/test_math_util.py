@@ -2,7 +2,7 @@ import math
 from decimal import Decimal
 from unittest import TestCase
 
-from hyperquant.utils.math_util import round_to_tick
+from hyperquant.utils.math_util import drop_trailing_zeros, round_to_tick
 
 
 class TestRoundToTick(TestCase):
@@ -48,3 +48,34 @@ class TestRoundToTick(TestCase):
         self.assertEqual(round_to_tick(10.1234567, 0.0002, math.ceil), 10.1234)
         self.assertEqual(round_to_tick(10.1234567, 0.00001, math.ceil), 10.12346)
         self.assertEqual(round_to_tick(10.1234567, 0.00002, math.ceil), 10.12346)
+
+        # (float and Decimal ticks of same value are cached apart)
+        self.assertEqual(round_to_tick(0.015292834630337397, 0.0001), 0.0153)
+        self.assertEqual(round_to_tick(Decimal("-0.015292834630337397"), 0.0001), Decimal("-0.0152"))
+
+        # (Decimals are compared as str, as str is what is sent in order params)
+        self.assertEqual(str(round_to_tick(Decimal("503.2"), 10)), "500")
+        self.assertEqual(str(round_to_tick(Decimal("12345"), 10)), "12340")
+        self.assertEqual(str(round_to_tick(Decimal("1234.5"), 100)), "1200")
+        self.assertEqual(str(round_to_tick(Decimal("10.6"), 1)), "11")
+        self.assertEqual(str(round_to_tick(Decimal("-0.42139"), 1)), "0")
+        self.assertEqual(str(round_to_tick(Decimal("-0.0042"), Decimal("0.01"))), "0.00")
+
+
+class TestDropTrailingZeros(TestCase):
+
+    def test_drop_trailing_zeros(self):
+        # Empty
+        self.assertEqual(str(drop_trailing_zeros(Decimal("0.000"))), "0")
+
+        # Normal
+        self.assertEqual(str(drop_trailing_zeros(Decimal("1.500"))), "1.5")
+        self.assertEqual(str(drop_trailing_zeros(Decimal("-0.00100"))), "-0.001")
+        self.assertEqual(str(drop_trailing_zeros(Decimal("10.0"))), "10")
+        self.assertEqual(str(drop_trailing_zeros(Decimal("100"))), "100")
+
+        # (more digits than context precision are kept exactly)
+        self.assertEqual(str(drop_trailing_zeros(Decimal("1.234567890123456789012345678912300"))),
+                         "1.2345678901234567890123456789123")
+        self.assertEqual(str(drop_trailing_zeros(Decimal("12345678901234567890123456789000"))),
+                         "12345678901234567890123456789000")
@@ -10,23 +10,28 @@ from hyperquant.utils.time_util import get_timestamp_ms, get_timestamp_s, get_ti
 
 
 class TestTimeUtil(unittest.TestCase):
-    timestamp_s = int(time.time() * 1000) / 1000
-    timestamp_ms = int(timestamp_s * 1000)
-    timestamp_s_str = str(timestamp_s)
-    timestamp_ms_str = str(timestamp_ms)
-    timestamp_iso = datetime.utcfromtimestamp(timestamp_s).isoformat()
-    timestamp_iso_like_str = timestamp_iso.replace("T", " ")
-    timestamp_datetime = datetime.utcfromtimestamp(timestamp_s)
-
-    item_dict1 = {ParamName.TIMESTAMP: timestamp_s}
-    item_dict2 = {ParamName.TIMESTAMP: timestamp_ms}
-    item_dict3 = {ParamName.TIMESTAMP: str(timestamp_s)}
-    item_dict4 = {ParamName.TIMESTAMP: str(timestamp_ms)}
-    item_obj1 = ItemObject(**item_dict1)  # , is_milliseconds=False)
-    item_obj2 = ItemObject(**item_dict2)  # , is_milliseconds=True)
-    item_obj3 = ItemObject(**item_dict3)  # , is_milliseconds=False)
-    item_obj4 = ItemObject(**item_dict4)  # , is_milliseconds=True)
-    candle = Candle(timestamp_close=timestamp_s, **item_dict4)  # , is_milliseconds=True)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # (Fixtures are created only if tests of this class run, not on import)
+        cls.timestamp_s = int(time.time() * 1000) / 1000
+        cls.timestamp_ms = int(cls.timestamp_s * 1000)
+        cls.timestamp_s_str = str(cls.timestamp_s)
+        cls.timestamp_ms_str = str(cls.timestamp_ms)
+        cls.timestamp_iso = datetime.utcfromtimestamp(cls.timestamp_s).isoformat()
+        cls.timestamp_iso_like_str = cls.timestamp_iso.replace("T", " ")
+        cls.timestamp_datetime = datetime.utcfromtimestamp(cls.timestamp_s)
+
+        cls.item_dict1 = {ParamName.TIMESTAMP: cls.timestamp_s}
+        cls.item_dict2 = {ParamName.TIMESTAMP: cls.timestamp_ms}
+        cls.item_dict3 = {ParamName.TIMESTAMP: str(cls.timestamp_s)}
+        cls.item_dict4 = {ParamName.TIMESTAMP: str(cls.timestamp_ms)}
+        cls.item_obj1 = ItemObject(**cls.item_dict1)  # , is_milliseconds=False)
+        cls.item_obj2 = ItemObject(**cls.item_dict2)  # , is_milliseconds=True)
+        cls.item_obj3 = ItemObject(**cls.item_dict3)  # , is_milliseconds=False)
+        cls.item_obj4 = ItemObject(**cls.item_dict4)  # , is_milliseconds=True)
+        cls.candle = Candle(timestamp_close=cls.timestamp_s, **cls.item_dict4)  # , is_milliseconds=True)
 
     def test_get_timestamp_ms(self):
         self._test_get_timestamp(get_timestamp_ms, self.timestamp_ms)
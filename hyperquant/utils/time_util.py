@@ -1,53 +1,118 @@
 import logging
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+
+try:
+    # (Optional: pip install hyperquant-framework[fast])
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
+
+# (UTC for naive datetimes. stdlib's one, so dateutil is not imported with the module)
+_tzutc = timezone.utc
+# (Lesser timestamps are considered to be in seconds)
+_max_timestamp_s = 1500000000 * 10
+# (Default for getattr() to know the attribute is missing, as None is a valid value)
+_missing = object()
+
+
+# (Same date strings come again and again in data, e.g. for all symbols of a candle.
+# Only absolute ISO dates are cached: relative ones like "14:00" depend on the current
+# date, and failures are not cached by lru_cache, so each of them is logged)
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_str_to_ms(value):
+    return _convert_datetime_to_ms(_parse_iso_datetime(value))
+
+
+def _parse_datetime_str_to_ms(value):
+    try:
+        # (ISO format is parsed in C much faster, dateutil's parser is for all other formats)
+        try:
+            return _parse_iso_datetime_str_to_ms(value)
+        except ValueError:
+            pass
+        # (Imported on first use, as ISO dates and numbers don't need dateutil's parser)
+        from dateutil import parser
+        return _convert_datetime_to_ms(parser.parse(value))
+    except:
+        logging.exception("Error while parsing %s as datetime. Return None.", value)
+        return None
 
-from dateutil import parser
-from dateutil.tz import tzutc
-from dateutil.utils import default_tzinfo
 
+def _convert_datetime_to_ms(dt):
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_tzutc)
+    return dt.timestamp() * 1000
 
-def get_timestamp_ms(value, timestamp_name="timestamp", is_parse_timestamp_only=False):
-    if not value and value != 0:
+
+def _convert_str_to_ms(value, is_parse_timestamp_only=False):
+    if not value:
         return None
+    # (Timestamps in ms usually come as digits only, and int() needs no float round-trip)
+    if value.isdecimal():
+        return _convert_to_ms(int(value))
+    try:
+        return _convert_to_ms(float(value))
+    except ValueError:
+        if is_parse_timestamp_only:
+            return None
+        return _convert_to_ms(_parse_datetime_str_to_ms(value))
+
+
+def _convert_to_ms(result):
+    # s -> ms
+    if result is not None and result < _max_timestamp_s:
+        result *= 1000
+    # (Only float may need to be converted to int)
+    if not isinstance(result, float):
+        return result
+    result_int = int(result)
+    return result_int if result_int == result else result
 
-    result = None
+
+def get_timestamp_ms(value, timestamp_name="timestamp", is_parse_timestamp_only=False):
+    # (Other empty values are handled below: "" by str helper, {} and [] give no timestamp)
+    if value is None:
+        return None
+    # (Fast paths for the most common cases - a number, as is or in s, and a string)
+    value_type = type(value)
+    if value_type is int:
+        return value * 1000 if value < _max_timestamp_s else value
+    if value_type is float:
+        return _convert_to_ms(value)
+    if value_type is str:
+        return _convert_str_to_ms(value, is_parse_timestamp_only)
 
     # From complex object type
     if isinstance(value, dict):
         value = value.get(timestamp_name)
-    elif hasattr(value, timestamp_name) and not isinstance(value, datetime):
-        value = getattr(value, timestamp_name)
+    elif not isinstance(value, datetime):
+        # (One getattr() instead of hasattr() and getattr())
+        attr_value = getattr(value, timestamp_name, _missing)
+        if attr_value is not _missing:
+            value = attr_value
 
     if not is_parse_timestamp_only and isinstance(value, datetime):
-        value = default_tzinfo(value, tzutc())
+        # (Naive datetime is in UTC. Aware one is used as is, without copying)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=_tzutc)
         value = value.timestamp()
 
     # From scalar type
     if isinstance(value, (int, float)):
-        result = value
-    elif isinstance(value, str):
-        try:
-            result = float(value)
-        except ValueError:
-            if not is_parse_timestamp_only:
-                try:
-                    dt = parser.parse(value)
-                    dt = default_tzinfo(dt, tzutc())
-                    result = dt.timestamp() * 1000
-                except:
-                    logging.exception("Error while parsing %s as datetime. Return None.", value)
-                    result = None
-
-    # s -> ms
-    if result is not None and result < 1500000000 * 10:
-        result *= 1000
-    result_int = int(result) if isinstance(result, float) else result
-
-    return result_int if result_int == result else result
+        return _convert_to_ms(value)
+    if isinstance(value, str):
+        return _convert_str_to_ms(value, is_parse_timestamp_only)
+    return None
 
 
 def get_timestamp_s(value, timestamp_name="timestamp", is_parse_timestamp_only=False):
+    value_type = type(value)
+    if (value_type is int or value_type is float) and value < _max_timestamp_s:
+        # (Already in s, no need to convert to ms and back)
+        result_int = int(value)
+        return result_int if result_int == value else value
     timestamp_ms = get_timestamp_ms(value, timestamp_name, is_parse_timestamp_only)
     if not timestamp_ms:
         return timestamp_ms
@@ -60,9 +125,13 @@ def get_timestamp_iso(value, timestamp_name="timestamp", is_parse_timestamp_only
     timestamp_ms = get_timestamp_ms(value, timestamp_name, is_parse_timestamp_only)
     if not timestamp_ms:
         return timestamp_ms
-    timestamp_s = timestamp_ms / 1000
-    result = datetime.utcfromtimestamp(timestamp_s).isoformat()
-    return result
+    return _convert_timestamp_ms_to_iso(timestamp_ms)
+
+
+@lru_cache(maxsize=2048)
+def _convert_timestamp_ms_to_iso(timestamp_ms):
+    # (Same timestamps come again and again, e.g. for candles of all symbols)
+    return datetime.utcfromtimestamp(timestamp_ms / 1000).isoformat()
 
 
 def get_timestamp(value, use_milliseconds=True, timestamp_name="timestamp", is_parse_timestamp_only=False):
@@ -70,40 +139,44 @@ def get_timestamp(value, use_milliseconds=True, timestamp_name="timestamp", is_p
         if use_milliseconds else get_timestamp_s(value, timestamp_name, is_parse_timestamp_only)
 
 
-_start_time_by_key = {}
-_stop_time_by_key = {}
+# (Monotonic times, only differences between them make sense)
+# (One [start_time, stop_time] list by key, as all functions need both times)
+_timing_by_key = {}
 
 
 def start_timings(*keys):
-    current_time = time.time()
+    current_time = time.monotonic()
     for key in keys:
-        _start_time_by_key[key] = current_time
-        if key in _stop_time_by_key:
-            del _stop_time_by_key[key]
+        _timing_by_key[key] = [current_time, None]
     return [0] * len(keys)
 
 
 def stop_timings(*keys):
-    current_time = time.time()
+    current_time = time.monotonic()
     result = []
     for key in keys:
-        _stop_time_by_key[key] = current_time
-        result.append(current_time - _start_time_by_key.get(key, current_time))
+        timing = _timing_by_key.get(key)
+        if timing:
+            timing[1] = current_time
+            result.append(current_time - timing[0])
+        else:
+            result.append(0.)
     return result
 
 
 def get_timings(*keys):
-    current_time = time.time()
+    current_time = time.monotonic()
     result = []
     for key in keys:
-        from_time = _stop_time_by_key.get(key, current_time)
-        result.append(from_time - _start_time_by_key.get(key, from_time))
+        timing = _timing_by_key.get(key)
+        if timing:
+            start_time, stop_time = timing
+            result.append((current_time if stop_time is None else stop_time) - start_time)
+        else:
+            result.append(0.)
     return result
 
 
 def get_timings_str(*keys):
     timings = get_timings(*keys)
-    result = "Elapsed time for"
-    for key, timing in zip(keys, timings):
-        result += " %s: %s s" % (key, timing)
-    return result
+    return "Elapsed time for" + "".join(f" {key}: {timing} s" for key, timing in zip(keys, timings))
@@ -9,6 +9,11 @@ REQUIREMENTS = [
     "python-dateutil>=2.8,<3",
 ]
 
+EXTRAS_REQUIREMENTS = {
+    # (Faster ISO 8601 date parsing, also for "Z"-suffixed dates on Python < 3.11)
+    "fast": ["ciso8601>=2.1,<3"],
+}
+
 setup(name="hyperquant-framework",
       version="0.1",
       description='HyperQuant Crypto-Trading Framework',
@@ -16,4 +21,5 @@ setup(name="hyperquant-framework",
       author_email='support@hyperquant.net',
       python_requires=PYTHON_VERSION,
       install_requires=REQUIREMENTS,
+      extras_require=EXTRAS_REQUIREMENTS,
       packages=find_packages())